@@ -1,11 +1,17 @@
+import io
+import tempfile
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sp
-import pandas as pd
-from metodos_numericos.euler_mejorado import euler_mejorado
-from metodos_numericos.runge_kutta4 import runge_kutta4
-from metodos_numericos.newton_raphson import newton_raphson
+from metodos_numericos.trapecio_implicito import es_rigida, LIMITE_ESTABILIDAD
+from metodos_numericos.newton_raphson import newton_raphson, halley, householder, secante, steffensen, CONVERGIO
+from metodos_numericos.instrumentacion import Estadisticas
+from metodos_numericos.polinomios import coeficientes, horner, raices_polinomio
+from metodos_numericos.expresiones import compilar, compilar_derivada
+from metodos_numericos.solucion_exacta import resolver_con_sympy
+from metodos_numericos.graficas import reducir_puntos, MAX_PUNTOS_CON_MARCADORES
+from metodos_numericos.almacenamiento import escribir_csv
+from metodos_numericos.lote import resolver_trabajo_en_cache
+# matplotlib y sympy se importan al usarse por primera vez para que la página cargue rápido
 
 # Estilos corporativos personalizados
 st.markdown("""
@@ -150,35 +156,6 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Función para resolver ODE analíticamente con SymPy
-def resolver_con_sympy(ecuacion_str, x0, y0):
-    """Intenta resolver la ODE analíticamente usando SymPy."""
-    try:
-        x_sym = sp.symbols('x')
-        y_sym = sp.Function('y')(x_sym)
-        
-        # Parsear la expresión con y como símbolo
-        f_sym = sp.sympify(ecuacion_str, locals={'x': x_sym, 'y': y_sym})
-        
-        # Definir la ecuación diferencial: dy/dx = f(x,y)
-        diffeq = sp.Eq(y_sym.diff(x_sym), f_sym)
-        
-        # Resolver con condición inicial
-        sol = sp.dsolve(diffeq, y_sym, ics={y_sym.subs(x_sym, x0): y0})
-        
-        # Retornar una función lambda para evaluar rápido
-        solucion_lambda = sp.lambdify(x_sym, sol.rhs, modules=['numpy', 'sympy'])
-        
-        # Validar que la función funciona
-        try:
-            test = float(solucion_lambda(x0))
-        except:
-            return None
-        
-        return solucion_lambda
-    except:
-        return None
-
 st.set_page_config(page_title="Métodos Numéricos", layout="wide", initial_sidebar_state="expanded")
 
 # Forzar tema claro
@@ -205,6 +182,167 @@ metodo = st.sidebar.selectbox(
     ["Euler Mejorado", "Runge-Kutta 4", "Newton-Raphson"]
 )
 
+# Filas que se envían al navegador en cada página de una tabla de resultados
+FILAS_POR_PAGINA = 1000
+
+# El CSV se escribe por bloques en un archivo temporal y se regresa como bytes:
+# Streamlit guarda la descarga completa en memoria, pero así sólo hay una
+# copia (no el texto en un StringIO, más la cadena y sus bytes)
+def tabla_csv(columnas):
+    with tempfile.TemporaryFile() as archivo:
+        texto = io.TextIOWrapper(archivo, encoding="utf-8", newline="")
+        escribir_csv(texto, columnas)
+        texto.flush()
+        texto.detach()
+        archivo.seek(0)
+        return archivo.read()
+
+def tabla_npz(columnas):
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **columnas)
+    return buffer.getvalue()
+
+# Tabla de resultados por columnas: sólo se envía al navegador la página (o una
+# muestra) visible, y la tabla completa se genera como archivo al descargarla.
+# Es un fragmento: cambiar de página no vuelve a ejecutar el cálculo.
+@st.fragment
+def mostrar_tabla(columnas, clave):
+    columnas = {nombre: np.asarray(valores) for nombre, valores in columnas.items()}
+    n = len(next(iter(columnas.values())))
+    filas = np.arange(n)
+    
+    if n > FILAS_POR_PAGINA:
+        col_vista, col_pagina = st.columns(2)
+        vista = col_vista.radio("Vista:", ["Página", "Muestra"], horizontal=True, key=f"{clave}_vista")
+        if vista == "Página":
+            paginas = -(-n // FILAS_POR_PAGINA)
+            pagina = col_pagina.number_input(
+                f"Página (de {paginas}):", min_value=1, max_value=paginas, value=1, key=f"{clave}_pagina"
+            )
+            filas = filas[(pagina - 1) * FILAS_POR_PAGINA:pagina * FILAS_POR_PAGINA]
+        else:
+            filas = np.unique(np.linspace(0, n - 1, FILAS_POR_PAGINA).astype(int))
+        st.caption(f"Mostrando {len(filas)} de {n} filas.")
+    
+    import pandas as pd
+    st.dataframe(
+        pd.DataFrame({nombre: valores[filas] for nombre, valores in columnas.items()}, index=filas),
+        width='stretch'
+    )
+    
+    col_csv, col_npz = st.columns(2)
+    col_csv.download_button(
+        "Descargar tabla completa (CSV)", data=lambda: tabla_csv(columnas),
+        file_name=f"{clave}.csv", mime="text/csv", on_click="ignore", key=f"{clave}_csv"
+    )
+    col_npz.download_button(
+        "Descargar tabla completa (NPZ)", data=lambda: tabla_npz(columnas),
+        file_name=f"{clave}.npz", mime="application/octet-stream", on_click="ignore", key=f"{clave}_npz"
+    )
+
+def aviso_rigidez(ecuacion, f, x0, y0, x_final, h):
+    """Advierte si la ecuación es rígida y el paso h vuelve inestables a los métodos explícitos."""
+    try:
+        rigida, lam = es_rigida(f, compilar_derivada(ecuacion, 'y', ('x', 'y')), x0, y0, x_final)
+    except Exception:
+        return
+    if rigida and h * lam > LIMITE_ESTABILIDAD:
+        st.warning(
+            f"La ecuación es rígida (∂f/∂y ≈ {-lam:g}): los métodos explícitos sólo son estables con "
+            f"h < {LIMITE_ESTABILIDAD / lam:.2g}. Se recomienda el trapecio implícito (opción de Euler Mejorado)."
+        )
+    elif rigida:
+        st.info(
+            f"La ecuación es rígida (∂f/∂y ≈ {-lam:g}): el trapecio implícito (TR-BDF2, opción de Euler "
+            "Mejorado) es estable con cualquier h, así que permite pasos más grandes si sólo interesa la "
+            "parte lenta de la solución."
+        )
+
+# Métodos de raíces disponibles en la página de Newton-Raphson
+METODOS_RAIZ = ["Newton-Raphson", "Halley", "Householder (orden 3)", "Secante", "Steffensen"]
+AUTOMATICO = "Automático (menos evaluaciones)"
+
+def resolver_raiz(nombre, ecuacion, x0, tol, max_iter, estadisticas=None, callback=None):
+    """Ejecuta un método de raíces; las derivadas se compilan sólo si el método las usa."""
+    f = compilar(ecuacion, ('x',))
+    if estadisticas is None:
+        estadisticas = Estadisticas()
+    if nombre == "Newton-Raphson":
+        raiz, iteraciones = newton_raphson(f, compilar_derivada(ecuacion, 'x'), x0, tol, max_iter,
+                                           estadisticas=estadisticas, callback=callback)
+    elif nombre == "Halley":
+        raiz, iteraciones = halley(
+            f, compilar_derivada(ecuacion, 'x'), compilar_derivada(ecuacion, 'x', orden=2),
+            x0, tol, max_iter, estadisticas=estadisticas, callback=callback
+        )
+    elif nombre == "Householder (orden 3)":
+        derivadas = [f] + [compilar_derivada(ecuacion, 'x', orden=k) for k in (1, 2, 3)]
+        raiz, iteraciones = householder(derivadas, x0, tol, max_iter, estadisticas=estadisticas, callback=callback)
+    elif nombre == "Secante":
+        raiz, iteraciones = secante(f, x0, tol=tol, max_iter=max_iter, estadisticas=estadisticas, callback=callback)
+    else:
+        raiz, iteraciones = steffensen(f, x0, tol, max_iter, estadisticas=estadisticas, callback=callback)
+    return raiz, iteraciones, estadisticas
+
+class _Descartado(Exception):
+    pass
+
+# Métodos de raíces por evaluaciones de f y sus derivadas en cada iteración
+# (secante 1, Newton y Steffensen 2, Halley 3, Householder 4)
+ORDEN_AUTOMATICO = ["Secante", "Newton-Raphson", "Steffensen", "Halley", "Householder (orden 3)"]
+
+def resolver_raiz_automatico(ecuacion, x0, tol, max_iter):
+    """
+    Se queda con el método que converge con menos evaluaciones. Los métodos
+    se prueban del más barato por iteración al más caro y cada uno se
+    descarta en cuanto iguala las evaluaciones del mejor hasta el momento.
+    """
+    mejor = None
+    for nombre in ORDEN_AUTOMATICO:
+        estadisticas = Estadisticas()
+
+        def descartar(i, x, estadisticas=estadisticas):
+            if mejor is not None and estadisticas.evaluaciones_f + estadisticas.evaluaciones_df >= mejor[0]:
+                raise _Descartado()
+
+        try:
+            raiz, iteraciones, estadisticas = resolver_raiz(nombre, ecuacion, x0, tol, max_iter, estadisticas, descartar)
+        except _Descartado:
+            continue
+        evaluaciones = estadisticas.evaluaciones_f + estadisticas.evaluaciones_df
+        if estadisticas.estado == CONVERGIO and (mejor is None or evaluaciones < mejor[0]):
+            mejor = (evaluaciones, nombre, raiz, iteraciones, estadisticas)
+    if mejor is None:
+        return METODOS_RAIZ[0], None, None, None
+    return mejor[1:]
+
+# Gráfica de una trayectoria (ya reducida con reducir_puntos) como PNG.
+# Se guarda en caché por resultado: volver a mostrar la misma solución no la redibuja.
+@st.cache_data(max_entries=32, show_spinner=False)
+def grafica_trayectoria(x, y, estilo, titulo, etiqueta=None, x_exacta=None, y_exacta=None):
+    import matplotlib.pyplot as plt
+    
+    # Los marcadores sólo ayudan cuando hay pocos puntos
+    if len(x) <= MAX_PUNTOS_CON_MARCADORES:
+        estilo += 'o'
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.plot(x, y, estilo, linewidth=2, markersize=6, label=etiqueta)
+    if x_exacta is not None:
+        ax.plot(x_exacta, y_exacta, 'g-', linewidth=2, label='Solución exacta')
+    
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('y', fontsize=12)
+    ax.set_title(titulo, fontsize=14)
+    if etiqueta is not None:
+        ax.legend()
+    
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
+    plt.close(fig)
+    return buffer.getvalue()
+
 # EULER MEJORADO
 if metodo == "Euler Mejorado":
     st.markdown("""
@@ -231,6 +369,10 @@ if metodo == "Euler Mejorado":
         y0 = st.number_input("y inicial (y0):", value=1.0)
         h = st.number_input("Paso (h):", value=0.1, min_value=0.01)
         x_final = st.number_input("x final:", value=2.0)
+        implicito = st.checkbox(
+            "Trapecio implícito (ecuaciones rígidas)", key="euler_implicito",
+            help="Resuelve cada paso con Newton-Raphson; es estable con cualquier h, p. ej. en -1000*(y - cos(x))."
+        )
     
     with col2:
         st.markdown("""
@@ -242,48 +384,44 @@ if metodo == "Euler Mejorado":
     
     if st.button("Calcular", key="euler"):
         try:
-            # Convertir ecuación a función con SymPy
-            x_sym, y_sym = sp.symbols('x y')
-            ecuacion_sym = sp.sympify(ecuacion)
-            f_lambda = sp.lambdify((x_sym, y_sym), ecuacion_sym, 'numpy')
+            # Convertir ecuación a función (compilada una sola vez por expresión)
+            f_lambda = compilar(ecuacion, ('x', 'y'))
             
-            def f(x, y):
-                return f_lambda(x, y)
+            # Intentar obtener la solución exacta (hasta TIEMPO_LIMITE segundos)
+            with st.spinner("Buscando la solución exacta con SymPy..."):
+                f_exacta = resolver_con_sympy(ecuacion, x0, y0)
             
-            # Intentar obtener la solución exacta
-            f_exacta = resolver_con_sympy(ecuacion, x0, y0)
+            if not implicito:
+                aviso_rigidez(ecuacion, f_lambda, x0, y0, x_final, h)
+            # Calcular Euler Mejorado (con predictor y etapas de cada paso) o el
+            # trapecio implícito; los resultados repetidos salen de la caché persistente
+            columnas, _, _, _ = resolver_trabajo_en_cache({
+                "metodo": "trapecio_implicito" if implicito else "euler_mejorado",
+                "ecuacion": ecuacion, "x0": x0, "y0": y0, "h": h, "x_final": x_final,
+            })
+            x_vals, y_vals = columnas["x"], columnas["y"]
             
-            # Calcular Euler Mejorado
-            x_vals, y_vals = euler_mejorado(f, x0, y0, h, x_final)
+            # Construir tabla por columnas; la última fila no tiene paso siguiente
+            y_next = np.append(y_vals[1:], np.nan)
+            tabla = {
+                "x": np.round(x_vals, 4),
+                "y": np.round(y_vals, 10),
+            }
+            if not implicito:
+                tabla["y*"] = np.round(columnas["y*"], 10)
+            tabla["y_next"] = np.round(y_next, 10)
+            tabla["Error Absoluto"] = np.round(np.abs(y_next - y_vals), 10)
             
-            # Construir tabla con detalles
-            datos_tabla = []
-            for i in range(len(x_vals)):
-                x_i = x_vals[i]
-                y_i = y_vals[i]
-                
-                # Cálculo de una fila (k1, k2, y predictor, y mejorado)
-                if i < len(x_vals) - 1:
-                    k1 = f(x_i, y_i)
-                    y_pred = y_i + h * k1
-                    k2 = f(x_vals[i+1], y_pred)
-                    y_mej = y_i + (h/2) * (k1 + k2)
-                    err_abs = abs(y_mej - y_i)
-                    
-                    datos_tabla.append({
-                        "x": round(x_i, 4),
-                        "y": round(y_i, 10),
-                        "y*": round(y_pred, 10),
-                        "y_next": round(y_mej, 10),
-                        "Error Absoluto": round(err_abs, 10)
-                    })
-                else:
-                    datos_tabla.append({
-                        "x": round(x_i, 4),
-                        "y": round(y_i, 10),
-                        "y*": np.nan,"y_next": np.nan,
-                        "Error Absoluto": np.nan
-                    })
+            # Comparar con la solución exacta (una sola evaluación vectorizada)
+            if f_exacta is not None:
+                y_exacta = np.broadcast_to(f_exacta(x_vals), x_vals.shape)
+                tabla["y exacta"] = np.round(y_exacta, 10)
+                error_exacta = np.abs(y_exacta - y_vals)
+                tabla["Error vs exacta"] = np.round(error_exacta, 10)
+                # Donde la solución exacta vale cero el error relativo no está definido (queda vacío)
+                relativo = np.divide(error_exacta, np.abs(y_exacta), out=np.full(x_vals.shape, np.nan),
+                                     where=y_exacta != 0)
+                tabla["Error Relativo"] = np.round(relativo, 10)
             
             # Mostrar tabla
             st.markdown("""
@@ -291,7 +429,7 @@ if metodo == "Euler Mejorado":
                     <h3 style='color: #367C2B; margin-top: 0;'>Resultados</h3>
                 </div>
             """, unsafe_allow_html=True)
-            st.dataframe(pd.DataFrame(datos_tabla), width='stretch')
+            mostrar_tabla(tabla, "euler_mejorado")
             
             if f_exacta is None:
                 st.markdown("""
@@ -300,16 +438,18 @@ if metodo == "Euler Mejorado":
                     </div>
                 """, unsafe_allow_html=True)
             
-            # Mostrar gráfica
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.plot(x_vals, y_vals, 'r-o', linewidth=2, markersize=6, label='Euler Mejorado')
-  
-            
-            ax.grid(True, alpha=0.3)
-            ax.set_xlabel('x', fontsize=12)
-            ax.set_ylabel('y', fontsize=12)
-            ax.set_title('Solución - Método de Euler Mejorado', fontsize=14)
-            st.pyplot(fig)
+            # Mostrar gráfica (reducida a la resolución de pantalla)
+            x_exacta = y_exacta_fina = None
+            if f_exacta is not None:
+                x_exacta = np.linspace(x_vals[0], x_vals[-1], 500)
+                y_exacta_fina = np.broadcast_to(f_exacta(x_exacta), x_exacta.shape)
+            x_graf, y_graf = reducir_puntos(x_vals, y_vals)
+            nombre_metodo = "Trapecio Implícito" if implicito else "Euler Mejorado"
+            st.image(
+                grafica_trayectoria(x_graf, y_graf, 'r-', f'Solución - Método de {nombre_metodo}',
+                                    nombre_metodo, x_exacta, y_exacta_fina),
+                width='stretch'
+            )
             
         except Exception as e:
             st.markdown(f"""
@@ -356,15 +496,14 @@ elif metodo == "Runge-Kutta 4":
     
     if st.button("Calcular", key="rk4"):
         try:
-            # Convertir ecuación a función con SymPy
-            x_sym, y_sym = sp.symbols('x y')
-            ecuacion_sym = sp.sympify(ecuacion)
-            f_lambda = sp.lambdify((x_sym, y_sym), ecuacion_sym, 'numpy')
-            
-            def f(x, y):
-                return f_lambda(x, y)
+            # Convertir ecuación a función (compilada una sola vez por expresión)
+            f_lambda = compilar(ecuacion, ('x', 'y'))
             
-            x, y, k1, k2, k3, k4 = runge_kutta4(f, x0, y0, x_end, h)
+            aviso_rigidez(ecuacion, f_lambda, x0, y0, x_end, h)
+            columnas, _, _, _ = resolver_trabajo_en_cache({
+                "metodo": "runge_kutta4", "ecuacion": ecuacion, "x0": x0, "y0": y0, "h": h, "x_final": x_end,
+            })
+            x, y = columnas["x"], columnas["y"]
             
             # Mostrar tabla
             st.markdown("""
@@ -372,25 +511,23 @@ elif metodo == "Runge-Kutta 4":
                     <h3 style='color: #367C2B; margin-top: 0;'>Resultados</h3>
                 </div>
             """, unsafe_allow_html=True)
-            df_data = {
+            tabla = {
                 "x": x,
                 "y": y,
-                "y(n+1)": list(y[1:]) + [np.nan],
-                "K1": list(k1) + [np.nan],
-                "K2": list(k2) + [np.nan],
-                "K3": list(k3) + [np.nan],
-                "K4": list(k4) + [np.nan],
+                "y(n+1)": np.append(y[1:], np.nan),
+                "K1": columnas["k1"],
+                "K2": columnas["k2"],
+                "K3": columnas["k3"],
+                "K4": columnas["k4"],
             }
-            st.dataframe(df_data, width='stretch')
+            mostrar_tabla(tabla, "runge_kutta4")
             
-            # Mostrar gráfica
-            fig, ax = plt.subplots(figsize=(10, 6))
-            ax.plot(x, y, 'b-o', linewidth=2, markersize=6)
-            ax.grid(True, alpha=0.3)
-            ax.set_xlabel('x', fontsize=12)
-            ax.set_ylabel('y', fontsize=12)
-            ax.set_title('Solución - Método de Runge-Kutta 4', fontsize=14)
-            st.pyplot(fig)
+            # Mostrar gráfica (reducida a la resolución de pantalla)
+            x_graf, y_graf = reducir_puntos(x, y)
+            st.image(
+                grafica_trayectoria(x_graf, y_graf, 'b-', 'Solución - Método de Runge-Kutta 4'),
+                width='stretch'
+            )
             
         except Exception as e:
             st.markdown(f"""
@@ -425,6 +562,10 @@ elif metodo == "Newton-Raphson":
         x0 = st.number_input("x inicial (x0):", value=3.0, key="nr_x0")
         tol = st.number_input("Tolerancia:", value=1e-7, format="%.0e", key="nr_tol")
         max_iter = st.number_input("Máximo de iteraciones:", value=1000, key="nr_iter")
+        metodo_raiz = st.selectbox(
+            "Método:", METODOS_RAIZ + [AUTOMATICO], key="nr_metodo",
+            help="Halley y Householder usan derivadas de mayor orden (menos iteraciones); Secante y Steffensen no usan derivadas."
+        )
     
     with col2:
         st.markdown("""
@@ -436,23 +577,14 @@ elif metodo == "Newton-Raphson":
     
     if st.button("Calcular", key="nr"):
         try:
-            # Crear variable simbólica
-            x = sp.Symbol('x')
-            
-            # Parsear la ecuación directamente (reconoce funciones automáticamente)
-            ecuacion_sym = sp.sympify(ecuacion.replace('^', '**'))
-            
-            # Calcular derivada automáticamente
-            derivada_sym = sp.diff(ecuacion_sym, x)
+            # Compilar f(x) y su derivada (calculadas simbólicamente una sola vez)
+            f = compilar(ecuacion, ('x',))
+            df = compilar_derivada(ecuacion, 'x')
             
-            # Convertir a funciones evaluables
-            def f(x_val):
-                return float(ecuacion_sym.subs(x, x_val))
-            
-            def df(x_val):
-                return float(derivada_sym.subs(x, x_val))
-            
-            raiz, iteraciones = newton_raphson(f, df, x0, tol, max_iter)
+            if metodo_raiz == AUTOMATICO:
+                metodo_raiz, raiz, iteraciones, estadisticas = resolver_raiz_automatico(ecuacion, x0, tol, max_iter)
+            else:
+                raiz, iteraciones, estadisticas = resolver_raiz(metodo_raiz, ecuacion, x0, tol, max_iter)
             
             if raiz is not None:
                 st.markdown("""
@@ -461,6 +593,10 @@ elif metodo == "Newton-Raphson":
                         <p style='margin: 10px 0 0 0; color: #367C2B; font-size: 2em; font-weight: 700;'>{:.10f}</p>
                     </div>
                 """.format(raiz), unsafe_allow_html=True)
+                st.caption(
+                    f"Método: {metodo_raiz} · {estadisticas.iteraciones} iteraciones · "
+                    f"{estadisticas.evaluaciones_f} evaluaciones de f y {estadisticas.evaluaciones_df} de derivadas"
+                )
                 
                 # Mostrar tabla de iteraciones con detalles
                 st.markdown("""
@@ -468,20 +604,22 @@ elif metodo == "Newton-Raphson":
                         <h3 style='color: #367C2B; margin-top: 0;'>Iteraciones</h3>
                     </div>
                 """, unsafe_allow_html=True)
+                x_iter = np.array(iteraciones)
                 tabla_iteraciones = {
-                    "i": list(range(len(iteraciones))),
-                    "x": iteraciones,
-                    "f(x)": [f(xi) for xi in iteraciones],
-                    "f'(x)": [df(xi) for xi in iteraciones]
+                    "i": np.arange(len(x_iter)),
+                    "x": x_iter,
+                    "f(x)": f(x_iter),
+                    "f'(x)": df(x_iter)
                 }
-                st.dataframe(tabla_iteraciones, width='stretch')
+                mostrar_tabla(tabla_iteraciones, "newton_raphson")
                 
                 # Mostrar gráfica
-                x_min = min(iteraciones) - 2
-                x_max = max(iteraciones) + 2
+                x_min = x_iter.min() - 2
+                x_max = x_iter.max() + 2
                 x_vals = np.linspace(x_min, x_max, 200)
-                y_vals = [f(xi) for xi in x_vals]
+                y_vals = f(x_vals)
                 
+                import matplotlib.pyplot as plt
                 fig, ax = plt.subplots(figsize=(10, 6))
                 ax.plot(x_vals, y_vals, 'g-', linewidth=2, label='f(x)')
                 ax.axhline(y=0, color='k', linestyle='--', alpha=0.3)
@@ -490,7 +628,7 @@ elif metodo == "Newton-Raphson":
                 ax.grid(True, alpha=0.3)
                 ax.set_xlabel('x', fontsize=12)
                 ax.set_ylabel('f(x)', fontsize=12)
-                ax.set_title('Método de Newton-Raphson', fontsize=14)
+                ax.set_title(f'Método de {metodo_raiz}', fontsize=14)
                 ax.legend()
                 st.pyplot(fig)
             else:
@@ -500,6 +638,26 @@ elif metodo == "Newton-Raphson":
                     </div>
                 """, unsafe_allow_html=True)
             
+            # Si f es un polinomio, mostrar todas sus raíces (sin depender de x0)
+            coef = coeficientes(ecuacion)
+            if coef is not None:
+                raices, convergio = raices_polinomio(coef)
+                st.markdown("""
+                    <div style='background-color: #f9f9f9; padding: 15px; border-radius: 4px; margin-top: 20px; margin-bottom: 20px;'>
+                        <h3 style='color: #367C2B; margin-top: 0;'>Todas las raíces del polinomio</h3>
+                    </div>
+                """, unsafe_allow_html=True)
+                if not convergio:
+                    st.warning("La iteración de Aberth no alcanzó la tolerancia; las raíces pueden ser imprecisas.")
+                valores, _ = horner(coef, raices)
+                tabla_raices = {
+                    "k": np.arange(1, len(raices) + 1),
+                    "Re(z)": raices.real,
+                    "Im(z)": raices.imag,
+                    "|p(z)|": np.abs(valores)
+                }
+                mostrar_tabla(tabla_raices, "polinomio")
+            
         except Exception as e:
             st.markdown(f"""
                 <div style='background-color: #ffebee; border-left: 4px solid #c62828; border-radius: 4px; padding: 20px;'>
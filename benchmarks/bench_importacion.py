@@ -0,0 +1,86 @@
+"""
+Benchmark del tiempo de importación del paquete metodos_numericos.
+
+Cada módulo del paquete se importa en un intérprete nuevo (importación en
+frío) y se verifica que no cargue dependencias pesadas (sympy, matplotlib,
+pandas, streamlit, numba) al importarse, salvo los opcionales listados en
+PESADOS_ESPERADOS. También se compara el tiempo
+con un máximo permitido para que la importación no vuelva a crecer.
+
+Uso (desde la raíz del repositorio):
+
+    python benchmarks/bench_importacion.py
+    python benchmarks/bench_importacion.py --max-ms 300
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAQUETE = os.path.join(RAIZ, "metodos_numericos")
+# Módulos opcionales que cargan a propósito una dependencia pesada: se miden
+# y se reportan, pero no cuentan como regresión
+PESADOS_ESPERADOS = {
+    "metodos_numericos.compilado": ["numba"],
+}
+# Todos los demás módulos del paquete deben poder importarse sólo con NumPy
+MODULOS = sorted(
+    "metodos_numericos." + archivo[:-3]
+    for archivo in os.listdir(PAQUETE)
+    if archivo.endswith(".py") and archivo != "__init__.py"
+)
+PESADOS = ["sympy", "matplotlib", "pandas", "streamlit", "numba"]
+
+PROGRAMA = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulo}
+tiempo = time.perf_counter() - inicio
+print(json.dumps({{"tiempo_s": tiempo, "pesados": [m for m in {pesados!r} if m in sys.modules]}}))
+"""
+
+
+def medir_importacion(modulo, repeticiones):
+    """Mejor tiempo de importación en frío y dependencias pesadas cargadas."""
+    mejor, pesados = None, []
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-c", PROGRAMA.format(modulo=modulo, pesados=PESADOS)],
+            cwd=RAIZ, capture_output=True, text=True, check=True,
+        )
+        resultado = json.loads(salida.stdout)
+        if mejor is None or resultado["tiempo_s"] < mejor:
+            mejor = resultado["tiempo_s"]
+        pesados = resultado["pesados"]
+    return mejor, pesados
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=500.0, help="Tiempo máximo de importación por módulo.")
+    args = parser.parse_args(argv)
+
+    fallas = []
+    for modulo in MODULOS:
+        tiempo, pesados = medir_importacion(modulo, args.repeticiones)
+        print(f"{modulo:40s} {tiempo * 1e3:9.1f} ms  {', '.join(pesados)}")
+        esperados = PESADOS_ESPERADOS.get(modulo)
+        inesperados = [nombre for nombre in pesados if nombre not in (esperados or [])]
+        if inesperados:
+            fallas.append(f"{modulo} importa {', '.join(inesperados)}")
+        if esperados is None and tiempo * 1e3 > args.max_ms:
+            fallas.append(f"{modulo} tarda {tiempo * 1e3:.1f} ms (máximo {args.max_ms} ms)")
+
+    for falla in fallas:
+        print(f"REGRESIÓN: {falla}")
+    if not fallas:
+        print("Importación sin dependencias pesadas y dentro del tiempo permitido.")
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
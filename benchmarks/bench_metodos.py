@@ -0,0 +1,199 @@
+"""
+Benchmarks de los métodos numéricos con seguimiento de regresiones.
+
+Ejecuta Euler Mejorado, Runge-Kutta 4 y Newton-Raphson sobre una matriz de
+número de pasos, tipos de ecuación, backends de evaluación (función de
+Python, función de NumPy compilada con lambdify o, si está instalado,
+el backend compilado con Numba) y tamaños de lote.
+Guarda tiempo, evaluaciones de f por segundo y memoria pico en JSON y los
+compara con una línea base guardada.
+
+Uso (desde la raíz del repositorio):
+
+    python benchmarks/bench_metodos.py                    # hasta 10^5 pasos
+    python benchmarks/bench_metodos.py --max-pasos 1e7    # matriz completa
+    python benchmarks/bench_metodos.py --guardar-base     # fija la línea base
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metodos_numericos.euler_mejorado import euler_mejorado, euler_mejorado_lote
+from metodos_numericos.runge_kutta4 import runge_kutta4, runge_kutta4_lote
+from metodos_numericos.newton_raphson import newton_raphson, newton_raphson_multiple
+from metodos_numericos.expresiones import compilar, compilar_derivada
+from metodos_numericos import compilado
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+BASE_POR_DEFECTO = os.path.join(DIRECTORIO, "base.json")
+SALIDA_POR_DEFECTO = os.path.join(DIRECTORIO, "resultados.json")
+
+# Ecuaciones dy/dx = f(x, y): texto para lambdify y equivalente en Python puro
+ECUACIONES_ED = {
+    "polinomial": ("x + 2*y", lambda x, y: x + 2*y),
+    "trascendental": ("y*sin(x) + exp(-x)", lambda x, y: y*math.sin(x) + math.exp(-x)),
+    "rigida": ("-1000*(y - cos(x))", lambda x, y: -1000*(y - math.cos(x))),
+}
+
+# Funciones f(x) = 0 con su derivada en Python puro
+ECUACIONES_RAIZ = {
+    "polinomial": ("x**3 - 2*x - 5", lambda x: x**3 - 2*x - 5, lambda x: 3*x**2 - 2),
+    "trascendental": ("sin(x) - x/2", lambda x: math.sin(x) - x/2, lambda x: math.cos(x) - 0.5),
+}
+
+PASOS = [10**2, 10**3, 10**4, 10**5, 10**6, 10**7]
+LOTES = [1, 100, 10000]
+
+
+def medir(funcion, repeticiones, memoria):
+    """Regresa el mejor tiempo de `repeticiones` corridas y la memoria pico."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    pico = None
+    if memoria:
+        tracemalloc.start()
+        funcion()
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return min(tiempos), pico
+
+
+def casos_ed(max_pasos):
+    for metodo, evaluaciones_por_paso in (("euler_mejorado", 2), ("runge_kutta4", 4)):
+        for nombre, (texto, f_python) in ECUACIONES_ED.items():
+            f_numpy = compilar(texto, ('x', 'y'))
+            for pasos in PASOS:
+                if pasos > max_pasos:
+                    continue
+                h = 1.0 / pasos
+                for backend, f in (("python", f_python), ("numpy", f_numpy)):
+                    if metodo == "euler_mejorado":
+                        correr = lambda f=f, h=h: euler_mejorado(f, 0.0, 1.0, h, 1.0)
+                    else:
+                        correr = lambda f=f, h=h: runge_kutta4(f, 0.0, 1.0, 1.0, h)
+                    yield (metodo, nombre, backend, pasos, 1), correr, evaluaciones_por_paso * pasos
+
+                if compilado.kernels(texto) is not None:
+                    if metodo == "euler_mejorado":
+                        correr = lambda h=h, texto=texto: compilado.euler_mejorado_compilado(texto, 0.0, 1.0, h, 1.0)
+                    else:
+                        correr = lambda h=h, texto=texto: compilado.runge_kutta4_compilado(texto, 0.0, 1.0, 1.0, h)
+                    yield (metodo, nombre, "numba", pasos, 1), correr, evaluaciones_por_paso * pasos
+
+                for lote in LOTES[1:]:
+                    if pasos * lote > 100 * max_pasos:
+                        continue
+                    y0 = np.linspace(0.5, 1.5, lote)
+                    if metodo == "euler_mejorado":
+                        correr = lambda h=h, y0=y0: euler_mejorado_lote(f_numpy, 0.0, y0, h, 1.0)
+                    else:
+                        correr = lambda h=h, y0=y0: runge_kutta4_lote(f_numpy, 0.0, y0, 1.0, h)
+                    yield (metodo, nombre, "numpy", pasos, lote), correr, evaluaciones_por_paso * pasos * lote
+
+
+def casos_raiz():
+    for nombre, (texto, f_python, df_python) in ECUACIONES_RAIZ.items():
+        f_numpy = compilar(texto, ('x',))
+        df_numpy = compilar_derivada(texto, 'x')
+        for backend, f, df in (("python", f_python, df_python), ("numpy", f_numpy, df_numpy)):
+            correr = lambda f=f, df=df: newton_raphson(f, df, 3.0, 1e-12, 1000)
+            yield ("newton_raphson", nombre, backend, 0, 1), correr, None
+
+        for lote in LOTES[1:]:
+            x0 = np.linspace(-10, 10, lote)
+            correr = lambda x0=x0: newton_raphson_multiple(f_numpy, df_numpy, x0, 1e-12, 100)
+            yield ("newton_raphson", nombre, "numpy", 0, lote), correr, None
+
+
+def clave(caso):
+    metodo, ecuacion, backend, pasos, lote = caso
+    return f"{metodo}|{ecuacion}|{backend}|pasos={pasos}|lote={lote}"
+
+
+def ejecutar(max_pasos, repeticiones, memoria):
+    resultados = {}
+    todos = list(casos_ed(max_pasos)) + list(casos_raiz())
+    for caso, correr, evaluaciones in todos:
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            warnings.simplefilter("ignore")
+            tiempo, pico = medir(correr, repeticiones, memoria)
+        resultados[clave(caso)] = {
+            "tiempo_s": tiempo,
+            "evaluaciones_por_s": evaluaciones / tiempo if evaluaciones else None,
+            "memoria_pico_bytes": pico,
+        }
+        print(f"{clave(caso):70s} {tiempo * 1e3:12.3f} ms")
+    return resultados
+
+
+def comparar(resultados, base, umbral):
+    """Lista los casos cuyo tiempo empeoró más de `umbral` respecto a la base."""
+    regresiones = []
+    for nombre, actual in resultados.items():
+        anterior = base.get(nombre)
+        if anterior is None:
+            continue
+        razon = actual["tiempo_s"] / anterior["tiempo_s"]
+        if razon > 1 + umbral:
+            regresiones.append((nombre, razon))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-pasos", type=float, default=1e5, help="Máximo número de pasos (hasta 1e7).")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--sin-memoria", action="store_true", help="No medir la memoria pico.")
+    parser.add_argument("--salida", default=SALIDA_POR_DEFECTO)
+    parser.add_argument("--base", default=BASE_POR_DEFECTO)
+    parser.add_argument("--guardar-base", action="store_true", help="Guardar estos resultados como línea base.")
+    parser.add_argument("--umbral", type=float, default=0.2, help="Aumento de tiempo tolerado (0.2 = 20%%).")
+    args = parser.parse_args(argv)
+
+    resultados = ejecutar(int(args.max_pasos), args.repeticiones, not args.sin_memoria)
+    reporte = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    with open(args.salida, "w", encoding="utf-8") as archivo:
+        json.dump(reporte, archivo, indent=2)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.guardar_base:
+        with open(args.base, "w", encoding="utf-8") as archivo:
+            json.dump(reporte, archivo, indent=2)
+        print(f"Línea base guardada en {args.base}")
+        return 0
+
+    if not os.path.exists(args.base):
+        print("No hay línea base; usa --guardar-base para crearla.")
+        return 0
+
+    with open(args.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)["resultados"]
+    regresiones = comparar(resultados, base, args.umbral)
+    for nombre, razon in regresiones:
+        print(f"REGRESIÓN {nombre}: {razon:.2f}x más lento que la base")
+    if not regresiones:
+        print("Sin regresiones respecto a la línea base.")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+def escribir_npy(ruta, bloques, n_filas, columnas=None, metadatos=None, dtype=np.float64):
+    """
+    Escribe una trayectoria generada por bloques en un archivo .npy.
+
+    bloques es un iterable de tuplas de columnas, como las que generan
+    euler_mejorado_por_bloques y runge_kutta4_por_bloques. El archivo se
+    abre mapeado en memoria con forma (n_filas, n_columnas) y cada bloque se
+    copia en su lugar, así que la memoria usada no depende de n_filas.
+
+    Si se dan nombres de columnas o metadatos se guardan junto al archivo en
+    `<ruta>.json`. Regresa el número de filas escritas.
+    """
+    salida = None
+    fila = 0
+    for bloque in bloques:
+        datos = np.column_stack(bloque)
+        if salida is None:
+            salida = open_memmap(ruta, mode='w+', dtype=dtype, shape=(n_filas, datos.shape[1]))
+        salida[fila:fila + len(datos)] = datos
+        fila += len(datos)
+
+    if salida is not None:
+        salida.flush()
+        del salida
+
+    if columnas is not None or metadatos is not None:
+        with open(str(ruta) + ".json", "w", encoding="utf-8") as archivo:
+            json.dump({"columnas": columnas, "filas": fila, "metadatos": metadatos}, archivo, indent=2)
+
+    return fila
+
+
+def leer_npy(ruta):
+    """Abre una trayectoria .npy mapeada en memoria (sin copiarla a RAM)."""
+    return np.load(ruta, mmap_mode='r')
+
+
+def escribir_csv(archivo, columnas, tam_bloque=100000):
+    """
+    Escribe una tabla por columnas (diccionario de arreglos) como CSV.
+
+    Las filas se formatean por bloques de tam_bloque para no construir el
+    texto de toda la tabla a la vez. archivo es un objeto de texto abierto.
+    """
+    nombres = list(columnas)
+    arreglos = [np.asarray(columnas[nombre]) for nombre in nombres]
+    archivo.write(",".join(nombres) + "\n")
+    n_filas = len(arreglos[0]) if arreglos else 0
+    for inicio in range(0, n_filas, tam_bloque):
+        bloque = np.column_stack([a[inicio:inicio + tam_bloque] for a in arreglos])
+        np.savetxt(archivo, bloque, delimiter=",", fmt="%.17g")
+
+
+def guardar_columnas(ruta_base, columnas, formato="csv"):
+    """
+    Guarda una tabla por columnas en `ruta_base.<formato>`.
+
+    Formatos: csv, npz (un arreglo por columna) y parquet (requiere pandas
+    y pyarrow). Regresa la ruta del archivo escrito.
+    """
+    ruta = f"{ruta_base}.{formato}"
+    if formato == "csv":
+        with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+            escribir_csv(archivo, columnas)
+    elif formato == "npz":
+        np.savez(ruta, **{nombre: np.asarray(valores) for nombre, valores in columnas.items()})
+    elif formato == "parquet":
+        import pandas as pd
+        pd.DataFrame({nombre: np.asarray(valores) for nombre, valores in columnas.items()}).to_parquet(ruta)
+    else:
+        raise ValueError(f"Formato no soportado: {formato}")
+    return ruta
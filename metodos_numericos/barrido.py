@@ -0,0 +1,152 @@
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from metodos_numericos.euler_mejorado import euler_mejorado
+from metodos_numericos.runge_kutta4 import runge_kutta4
+from metodos_numericos.expresiones import compilar
+
+PARAMETROS = ("metodo", "ecuacion", "x0", "y0", "h", "x_final")
+RESULTADOS = ("y_final", "pasos", "tiempo_s", "error")
+
+
+def malla_parametros(metodos, ecuaciones, x0, y0, h, x_final):
+    """Producto cartesiano de listas de parámetros como lista de diccionarios."""
+    return [
+        dict(zip(PARAMETROS, valores))
+        for valores in itertools.product(metodos, ecuaciones, x0, y0, h, x_final)
+    ]
+
+
+def _resolver_uno(combinacion):
+    """Resuelve una combinación; se ejecuta dentro de un proceso trabajador."""
+    inicio = time.perf_counter()
+    try:
+        # Las ecuaciones viajan como texto y se compilan (con caché) en el trabajador
+        f = compilar(combinacion["ecuacion"], ('x', 'y'))
+        metodo = combinacion["metodo"]
+        if metodo == "euler_mejorado":
+            x, y = euler_mejorado(f, combinacion["x0"], combinacion["y0"], combinacion["h"], combinacion["x_final"])
+        elif metodo == "runge_kutta4":
+            x, y = runge_kutta4(f, combinacion["x0"], combinacion["y0"], combinacion["x_final"], combinacion["h"])[:2]
+        else:
+            raise ValueError(f"Método desconocido: {metodo}")
+        return float(y[-1]), len(x) - 1, time.perf_counter() - inicio, ""
+    except Exception as e:
+        return float("nan"), 0, time.perf_counter() - inicio, str(e)
+
+
+def _resolver_bloque(bloque):
+    return [_resolver_uno(combinacion) for combinacion in bloque]
+
+
+def huella(combinaciones, tam_bloque):
+    """Hash de las combinaciones y el tamaño de bloque que identifica un archivo de avance."""
+    texto = json.dumps({"combinaciones": combinaciones, "tam_bloque": tam_bloque}, sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _leer_avance(archivo_avance, huella_esperada):
+    """
+    Bloques ya terminados en una corrida anterior: {índice: resultados}.
+
+    La primera línea del archivo guarda la huella del barrido; lanza
+    ValueError si es de otro barrido (otras combinaciones u otro tam_bloque),
+    porque los índices de bloque no corresponderían. Regresa None si no hay
+    archivo o su primera línea quedó incompleta: no hay avance que usar.
+    """
+    if not archivo_avance or not os.path.exists(archivo_avance):
+        return None
+    with open(archivo_avance, encoding="utf-8") as archivo:
+        try:
+            encabezado = json.loads(next(archivo))
+        except (StopIteration, json.JSONDecodeError):
+            # Vacío o interrumpido antes de terminar de escribir la huella
+            return None
+        if not isinstance(encabezado, dict) or encabezado.get("huella") != huella_esperada:
+            raise ValueError(
+                f"{archivo_avance} es el avance de otro barrido (otras combinaciones o tam_bloque)."
+            )
+        terminados = {}
+        for linea in archivo:
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                # Línea incompleta por una interrupción a medio escribir
+                continue
+            terminados[registro["bloque"]] = registro["resultados"]
+    return terminados
+
+
+def _termina_incompleto(archivo_avance):
+    with open(archivo_avance, "rb") as archivo:
+        archivo.seek(-1, os.SEEK_END)
+        return archivo.read(1) != b"\n"
+
+
+def barrido(combinaciones, procesos=None, tam_bloque=64, progreso=None, archivo_avance=None):
+    """
+    Resuelve muchas combinaciones de parámetros en paralelo.
+
+    combinaciones es una lista de diccionarios con las llaves de PARAMETROS
+    (ver malla_parametros). Se reparten en bloques de tam_bloque entre
+    `procesos` procesos trabajadores (por defecto, uno por núcleo).
+
+    progreso(terminadas, total), si se da, se llama al terminar cada bloque.
+    Si se da archivo_avance, cada bloque terminado se agrega a ese archivo
+    (JSON por línea) y una nueva llamada con las mismas combinaciones salta
+    los bloques que ya estén ahí. El archivo empieza con la huella de
+    combinaciones y tam_bloque; si es de otro barrido se lanza ValueError
+    en lugar de mezclar resultados.
+
+    Regresa una tabla por columnas: diccionario de arreglos de NumPy con las
+    llaves de PARAMETROS y RESULTADOS.
+    """
+    bloques = [combinaciones[i:i + tam_bloque] for i in range(0, len(combinaciones), tam_bloque)]
+    huella_barrido = huella(combinaciones, tam_bloque)
+    resultados = _leer_avance(archivo_avance, huella_barrido)
+    # Sin avance utilizable el archivo se empieza de nuevo (con su huella)
+    modo = "w" if resultados is None else "a"
+    resultados = resultados or {}
+    pendientes = [i for i in range(len(bloques)) if i not in resultados]
+
+    terminadas = sum(len(bloques[i]) for i in resultados if i < len(bloques))
+    if progreso is not None:
+        progreso(terminadas, len(combinaciones))
+
+    avance = open(archivo_avance, modo, encoding="utf-8") if archivo_avance else None
+    if avance is not None and avance.tell() == 0:
+        avance.write(json.dumps({"huella": huella_barrido}) + "\n")
+        avance.flush()
+    elif avance is not None and _termina_incompleto(archivo_avance):
+        # Cerrar la línea incompleta para que el siguiente registro no quede pegado a ella
+        avance.write("\n")
+    try:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = {ejecutor.submit(_resolver_bloque, bloques[i]): i for i in pendientes}
+            for futuro in as_completed(futuros):
+                i = futuros[futuro]
+                resultados[i] = futuro.result()
+                if avance is not None:
+                    avance.write(json.dumps({"bloque": i, "resultados": resultados[i]}) + "\n")
+                    avance.flush()
+                terminadas += len(bloques[i])
+                if progreso is not None:
+                    progreso(terminadas, len(combinaciones))
+    finally:
+        if avance is not None:
+            avance.close()
+
+    filas = [fila for i in range(len(bloques)) for fila in resultados[i]]
+    tabla = {
+        nombre: np.array([combinacion[nombre] for combinacion in combinaciones])
+        for nombre in PARAMETROS
+    }
+    for j, nombre in enumerate(RESULTADOS):
+        tabla[nombre] = np.array([fila[j] for fila in filas])
+    return tabla
@@ -0,0 +1,188 @@
+"""
+Caché persistente de resultados, compartida entre sesiones y procesos.
+
+Cada resultado se guarda bajo el hash de (método, ecuación normalizada,
+parámetros, versión): la tabla por columnas en un archivo .npz y el resto en
+una base SQLite (indice.sqlite), en DIRECTORIO_CACHE. Varias réplicas pueden
+compartir el directorio (por ejemplo, un volumen de Docker). Cuando los
+archivos ocupan más de TAM_MAXIMO bytes se borran los resultados usados
+hace más tiempo.
+
+Variables de entorno: METODOS_CACHE_DIR (directorio), METODOS_CACHE_MB
+(tamaño máximo) y METODOS_CACHE=0 para desactivarla.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+from metodos_numericos.expresiones import normalizar
+
+# Cambiar cuando un método cambie sus resultados: invalida la caché anterior
+VERSION = "2"
+
+HABILITADA = os.environ.get("METODOS_CACHE", "1") != "0"
+DIRECTORIO_CACHE = os.environ.get(
+    "METODOS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "metodos_numericos", "resultados"),
+)
+TAM_MAXIMO = int(float(os.environ.get("METODOS_CACHE_MB", 512)) * 2**20)
+
+# Errores de lectura o escritura de la caché (disco, SQLite o archivos dañados);
+# quien usa la caché los trata como un resultado no guardado
+ERRORES_CACHE = (OSError, sqlite3.Error, ValueError, EOFError, zipfile.BadZipFile)
+
+# Campos del trabajo que no afectan el resultado
+CAMPOS_IGNORADOS = {"id", "plazo_s"}
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    clave TEXT PRIMARY KEY,
+    trabajo TEXT,
+    estado TEXT,
+    resultado REAL,
+    mensaje TEXT,
+    bytes INTEGER,
+    creado REAL,
+    usado REAL
+)
+"""
+
+
+def clave(trabajo):
+    """Hash SHA-256 del trabajo normalizado y las versiones de la biblioteca."""
+    datos = {campo: valor for campo, valor in trabajo.items() if campo not in CAMPOS_IGNORADOS}
+    for campo in ("ecuacion", "derivada"):
+        if campo in datos:
+            datos[campo] = normalizar(str(datos[campo]))
+    datos["_version"] = [VERSION, np.__version__]
+    texto = json.dumps(datos, sort_keys=True, default=str)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+def _conectar():
+    os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+    # Una conexión por operación: SQLite no permite compartirlas entre hilos
+    conexion = sqlite3.connect(os.path.join(DIRECTORIO_CACHE, "indice.sqlite"), timeout=30)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute(_ESQUEMA)
+    return conexion
+
+
+def _ruta(llave):
+    return os.path.join(DIRECTORIO_CACHE, llave[:2], llave + ".npz")
+
+
+def obtener(trabajo):
+    """
+    Regresa (columnas, estado, resultado, mensaje) si el trabajo ya está en
+    la caché, o None.
+    """
+    llave = clave(trabajo)
+    conexion = _conectar()
+    try:
+        fila = conexion.execute(
+            "SELECT estado, resultado, mensaje FROM resultados WHERE clave = ?", (llave,)
+        ).fetchone()
+        if fila is None:
+            return None
+        try:
+            with np.load(_ruta(llave)) as datos:
+                columnas = {nombre: datos[nombre] for nombre in datos.files}
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+            # El archivo se borró (desalojo desde otra réplica) o está dañado: olvidar la entrada
+            with conexion:
+                conexion.execute("DELETE FROM resultados WHERE clave = ?", (llave,))
+            return None
+        with conexion:
+            conexion.execute("UPDATE resultados SET usado = ? WHERE clave = ?", (time.time(), llave))
+    finally:
+        conexion.close()
+
+    estado, resultado, mensaje = fila
+    return columnas, estado, float("nan") if resultado is None else resultado, mensaje
+
+
+def guardar(trabajo, columnas, estado, resultado, mensaje=""):
+    """Guarda el resultado de un trabajo y desaloja los más viejos si hace falta."""
+    llave = clave(trabajo)
+    ruta = _ruta(llave)
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    # Escritura atómica con un temporal único: otros hilos o réplicas pueden
+    # estar escribiendo o leyendo el mismo resultado a la vez
+    descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(ruta), suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            np.savez(archivo, **{nombre: np.asarray(valores) for nombre, valores in columnas.items()})
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)
+        except FileNotFoundError:
+            pass
+        raise
+
+    ahora = time.time()
+    datos = {campo: valor for campo, valor in trabajo.items() if campo not in CAMPOS_IGNORADOS}
+    conexion = _conectar()
+    try:
+        with conexion:
+            conexion.execute(
+                "INSERT OR REPLACE INTO resultados VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (llave, json.dumps(datos, default=str), estado, resultado, mensaje,
+                 os.path.getsize(ruta), ahora, ahora),
+            )
+        _desalojar(conexion)
+    finally:
+        conexion.close()
+
+
+def _desalojar(conexion):
+    """Borra los resultados usados hace más tiempo hasta bajar al 90 % de TAM_MAXIMO."""
+    total = conexion.execute("SELECT COALESCE(SUM(bytes), 0) FROM resultados").fetchone()[0]
+    if total <= TAM_MAXIMO:
+        return
+    borrar = []
+    for llave, tam in conexion.execute("SELECT clave, bytes FROM resultados ORDER BY usado"):
+        if total <= 0.9 * TAM_MAXIMO:
+            break
+        borrar.append(llave)
+        total -= tam
+    with conexion:
+        conexion.executemany("DELETE FROM resultados WHERE clave = ?", [(llave,) for llave in borrar])
+    for llave in borrar:
+        try:
+            os.remove(_ruta(llave))
+        except FileNotFoundError:
+            pass
+
+
+def estadisticas():
+    """Número de resultados guardados y bytes que ocupan."""
+    conexion = _conectar()
+    try:
+        n, total = conexion.execute("SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM resultados").fetchone()
+    finally:
+        conexion.close()
+    return {"resultados": n, "bytes": total, "tam_maximo": TAM_MAXIMO}
+
+
+def limpiar():
+    """Borra todos los resultados guardados."""
+    conexion = _conectar()
+    try:
+        llaves = [fila[0] for fila in conexion.execute("SELECT clave FROM resultados")]
+        with conexion:
+            conexion.execute("DELETE FROM resultados")
+    finally:
+        conexion.close()
+    for llave in llaves:
+        try:
+            os.remove(_ruta(llave))
+        except FileNotFoundError:
+            pass
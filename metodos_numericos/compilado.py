@@ -0,0 +1,180 @@
+"""
+Backend compilado (JIT con Numba) para Euler Mejorado y Runge-Kutta 4.
+
+A partir de la expresión de SymPy se genera el código fuente de f(x, y) y de
+los ciclos completos de cada método, y se compila con numba.njit. El código
+generado se escribe en un directorio de caché con nombre derivado de la
+expresión, y Numba guarda ahí mismo el código máquina (cache=True), así que
+las corridas siguientes no vuelven a compilar.
+
+Si Numba no está instalado, o la expresión usa funciones que no se pueden
+traducir, se usa el camino normal (compilar() + euler_mejorado/runge_kutta4).
+"""
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from metodos_numericos.euler_mejorado import euler_mejorado
+from metodos_numericos.runge_kutta4 import runge_kutta4
+from metodos_numericos.expresiones import compilar, expresion
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+DIRECTORIO_CACHE = os.environ.get(
+    "METODOS_JIT_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "metodos_numericos", "jit"),
+)
+
+PLANTILLA = '''\
+# Generado automáticamente por metodos_numericos.compilado para: {ecuacion}
+import math
+from numba import njit
+
+
+@njit(cache=True, error_model="numpy")
+def f(x, y):
+    return {cuerpo}
+
+
+@njit(cache=True, error_model="numpy")
+def euler_mejorado(x, y, h):
+    for i in range(len(x) - 1):
+        k1 = f(x[i], y[i])
+        y_pred = y[i] + h * k1
+        k2 = f(x[i+1], y_pred)
+        y[i+1] = y[i] + (h / 2) * (k1 + k2)
+
+
+@njit(cache=True, error_model="numpy")
+def runge_kutta4(x, y, h, k1, k2, k3, k4):
+    for i in range(len(x) - 1):
+        k1[i] = f(x[i], y[i])
+        k2[i] = f(x[i] + h/2, y[i] + (h/2) * k1[i])
+        k3[i] = f(x[i] + h/2, y[i] + (h/2) * k2[i])
+        k4[i] = f(x[i] + h, y[i] + h * k3[i])
+        y[i+1] = y[i] + (h / 6) * (k1[i] + 2*k2[i] + 2*k3[i] + k4[i])
+'''
+
+# Número máximo de ecuaciones cuyos módulos compilados se conservan
+TAM_CACHE = 64
+
+_modulos = OrderedDict()
+_candado = threading.Lock()
+
+
+def disponible():
+    """Indica si Numba está instalado."""
+    return numba is not None
+
+
+def _fuente(expr):
+    import sympy as sp
+    cuerpo = sp.pycode(expr, fully_qualified_modules=True)
+    return PLANTILLA.format(ecuacion=str(expr).replace("\n", " "), cuerpo=cuerpo)
+
+
+def _cargar(fuente):
+    """Escribe (si hace falta) e importa el módulo generado para `fuente`."""
+    nombre = "jit_" + hashlib.sha256(fuente.encode("utf-8")).hexdigest()[:24]
+    os.makedirs(DIRECTORIO_CACHE, exist_ok=True)
+    ruta = os.path.join(DIRECTORIO_CACHE, nombre + ".py")
+    if not os.path.exists(ruta):
+        # Escritura atómica: otro proceso puede estar leyendo el mismo archivo
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(fuente)
+        os.replace(temporal, ruta)
+
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(spec)
+    # Numba necesita encontrar el módulo por nombre al leer su caché en disco
+    sys.modules[nombre] = modulo
+    try:
+        spec.loader.exec_module(modulo)
+    except BaseException:
+        sys.modules.pop(nombre, None)
+        raise
+    return modulo
+
+
+def _compilar_todo(modulo):
+    """Compila ahora f y los ciclos: los errores de tipos aparecen en la primera llamada."""
+    modulo.f(0.0, 0.0)
+    # Mallas de un punto: el ciclo no corre, pero sí se compila con estos tipos
+    x, y, k = np.zeros(1), np.zeros(1), np.zeros(0)
+    modulo.euler_mejorado(x, y, 0.0)
+    modulo.runge_kutta4(x, y, 0.0, k, k, k, k)
+
+
+def kernels(ecuacion):
+    """
+    Regresa el módulo con f, euler_mejorado y runge_kutta4 compilados para
+    la ecuación, o None si no se puede usar el backend compilado. Todos se
+    compilan aquí, así que un error de compilación también lleva a None. Se
+    conservan los módulos de las últimas TAM_CACHE ecuaciones.
+    """
+    if numba is None:
+        return None
+
+    expr = expresion(ecuacion)
+    with _candado:
+        if expr in _modulos:
+            _modulos.move_to_end(expr)
+            return _modulos[expr]
+        modulo = None
+        try:
+            modulo = _cargar(_fuente(expr))
+            _compilar_todo(modulo)
+        except Exception:
+            if modulo is not None:
+                sys.modules.pop(modulo.__name__, None)
+            modulo = None
+        _modulos[expr] = modulo
+        while len(_modulos) > TAM_CACHE:
+            _, viejo = _modulos.popitem(last=False)
+            if viejo is not None:
+                sys.modules.pop(viejo.__name__, None)
+        return modulo
+
+
+def euler_mejorado_compilado(ecuacion, x0, y0, h, x_final):
+    """
+    Como euler_mejorado, pero recibe la ecuación como texto y ejecuta el
+    ciclo completo en código compilado cuando Numba está disponible.
+    """
+    modulo = kernels(ecuacion)
+    if modulo is None:
+        return euler_mejorado(compilar(ecuacion, ('x', 'y')), x0, y0, h, x_final)
+
+    x = np.arange(x0, x_final + h, h)
+    y = np.zeros(len(x))
+    y[0] = y0
+    modulo.euler_mejorado(x, y, float(h))
+    return x, y
+
+
+def runge_kutta4_compilado(ecuacion, x0, y0, x_final, h):
+    """
+    Como runge_kutta4 (y escalar), pero recibe la ecuación como texto y
+    ejecuta el ciclo completo en código compilado cuando Numba está
+    disponible.
+    """
+    modulo = kernels(ecuacion)
+    if modulo is None or np.ndim(y0) != 0:
+        return runge_kutta4(compilar(ecuacion, ('x', 'y')), x0, y0, x_final, h)
+
+    pasos = int(round((x_final - x0) / h))
+    x = np.linspace(x0, x_final, pasos + 1)
+    y = np.empty(pasos + 1)
+    k1, k2, k3, k4 = (np.empty(pasos) for _ in range(4))
+    y[0] = y0
+    modulo.runge_kutta4(x, y, float(h), k1, k2, k3, k4)
+    return x, y, k1, k2, k3, k4
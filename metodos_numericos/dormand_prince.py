@@ -0,0 +1,122 @@
+import numpy as np
+
+from metodos_numericos.instrumentacion import contar, fase
+
+# Tabla de Butcher de Dormand-Prince 5(4)
+C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+A = [
+    [],
+    [1/5],
+    [3/40, 9/40],
+    [44/45, -56/15, 32/9],
+    [19372/6561, -25360/2187, 64448/6561, -212/729],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656],
+    [35/384, 0, 500/1113, 125/192, -2187/6784, 11/84],
+]
+# Pesos de orden 5 (iguales a la última fila de A: propiedad FSAL)
+B5 = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# Diferencia entre los pesos de orden 5 y los de orden 4
+E = B5 - np.array([5179/57600, 0, 7571/16695, 393/640, -92097/339200, 187/2100, 1/40])
+
+
+def _norma_error(error, y, y_nuevo, rtol, atol):
+    escala = atol + rtol * np.maximum(np.abs(y), np.abs(y_nuevo))
+    return np.sqrt(np.mean((error / escala) ** 2))
+
+
+def _paso_inicial(f, x0, y0, k1, rtol, atol):
+    """Estimación del primer paso (Hairer, Nørsett y Wanner)."""
+    escala = atol + rtol * np.abs(y0)
+    d0 = np.sqrt(np.mean((y0 / escala) ** 2))
+    d1 = np.sqrt(np.mean((k1 / escala) ** 2))
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    k2 = f(x0 + h0, y0 + h0 * k1)
+    d2 = np.sqrt(np.mean(((k2 - k1) / escala) ** 2)) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+    return min(100 * h0, h1)
+
+
+def dormand_prince(f, x0, y0, x_final, rtol=1e-6, atol=1e-9, h=None, max_pasos=100000, estadisticas=None):
+    """
+    Resuelve dy/dx = f(x, y) con paso adaptativo usando Dormand-Prince 5(4).
+
+    El tamaño de paso se ajusta para mantener el error local dentro de
+    atol + rtol * |y|. La última etapa de cada paso aceptado se reutiliza
+    como primera etapa del siguiente (FSAL), así que cada paso cuesta 6
+    evaluaciones de f. y0 puede ser escalar o vector.
+
+    Regresa x, y y un diccionario con los pasos aceptados, rechazados y el
+    número de evaluaciones de f. Con estadisticas se cuentan además las
+    evaluaciones de f, se mide el tiempo de las fases pasos y salida (armar
+    x y y con los pasos aceptados) y se guardan los pasos aceptados en
+    iteraciones.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    y0 = np.asarray(y0, dtype=float)
+    escalar = y0.ndim == 0
+    y_i = np.atleast_1d(y0).copy()
+    if escalar:
+        def F(x, y):
+            return np.atleast_1d(f(x, y[0]))
+    else:
+        F = f
+
+    with fase(estadisticas, "pasos"):
+        x_i = x0
+        direccion = np.sign(x_final - x0)
+        k = np.empty((7,) + y_i.shape)
+        k[0] = F(x_i, y_i)
+        evaluaciones = 1
+
+        if h is None:
+            h = _paso_inicial(F, x_i, y_i, k[0], rtol, atol)
+            evaluaciones += 1
+        h = abs(h)
+
+        xs, ys = [x_i], [y_i.copy()]
+        aceptados = rechazados = 0
+
+        while direccion * (x_final - x_i) > 0:
+            if aceptados + rechazados >= max_pasos:
+                raise RuntimeError(f"Se alcanzó el máximo de {max_pasos} pasos antes de x = {x_final}.")
+
+            h = min(h, abs(x_final - x_i))
+            h_dir = direccion * h
+            for s in range(1, 7):
+                y_etapa = y_i + h_dir * np.dot(A[s], k[:s])
+                k[s] = F(x_i + C[s] * h_dir, y_etapa)
+            evaluaciones += 6
+
+            # y_etapa de la séptima etapa es la solución de orden 5
+            y_nuevo = y_etapa
+            error = h_dir * np.dot(E, k)
+            err = _norma_error(error, y_i, y_nuevo, rtol, atol)
+
+            if err <= 1:
+                aceptados += 1
+                x_i = x_i + h_dir
+                y_i = y_nuevo
+                k[0] = k[6]
+                xs.append(x_i)
+                ys.append(y_i.copy())
+                factor = 5.0 if err == 0 else min(5.0, 0.9 * err ** (-1 / 5))
+            else:
+                rechazados += 1
+                factor = max(0.2, 0.9 * err ** (-1 / 5))
+            h = h * factor
+
+    with fase(estadisticas, "salida"):
+        x = np.array(xs)
+        y = np.array(ys)
+        if escalar:
+            y = y[:, 0]
+
+    if estadisticas is not None:
+        estadisticas.iteraciones = aceptados
+
+    info = {"aceptados": aceptados, "rechazados": rechazados, "evaluaciones": evaluaciones}
+    return x, y, info
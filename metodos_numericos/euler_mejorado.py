@@ -1,18 +1,167 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from metodos_numericos.instrumentacion import contar, fase
+from metodos_numericos.salida import integrar_muestreado
 
-def euler_mejorado(f, x0, y0, h, x_final):
+def euler_mejorado(f, x0, y0, h, x_final, estadisticas=None, callback=None, etapas=False, cada=1,
+                   solo_final=False, dtype=np.float64):
     """
     Resuelve dy/dx = f(x, y) con y(x0) = y0 usando Euler Mejorado.
+
+    Con etapas=True regresa también los arreglos k1, y_pred (predictor y*) y
+    k2 de cada paso, de longitud len(x) - 1, como runge_kutta4 hace con
+    k1..k4.
+
+    cada, solo_final y dtype controlan qué se guarda, como en runge_kutta4:
+    uno de cada `cada` puntos (más el último), sólo el último punto, y el
+    tipo de y y de las etapas (p. ej. np.float32). Los pasos se calculan
+    igual en todos los casos.
+
+    Si se pasa un objeto Estadisticas se cuentan las evaluaciones de f y se
+    mide el tiempo de cada fase (malla, pasos y, si se guarda sólo parte de
+    la trayectoria, salida). callback(i, x, y), si se da, se llama después
+    de calcular cada punto nuevo.
     """
-    x = np.arange(x0, x_final + h, h)
-    y = np.zeros(len(x))
-    y[0] = y0
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    
+    if cada != 1 or solo_final or np.dtype(dtype) != np.float64:
+        n = numero_de_puntos(x0, h, x_final)
+        # np.arange calcula sus puntos como x0 + i * ((x0 + h) - x0)
+        delta = (x0 + h) - x0
+        
+        def x_en(indices):
+            return x0 + delta * indices
+        
+        def pasos_bloque(x, y, k, callback):
+            _pasos_euler(f, x, y, h, *k, callback)
+        
+        x, y, k = integrar_muestreado(
+            pasos_bloque, x_en, n, y0, 3, etapas, cada, solo_final, dtype, callback, estadisticas=estadisticas
+        )
+        if estadisticas is not None:
+            estadisticas.iteraciones = n - 1
+        return (x, y, *k) if etapas else (x, y)
+    
+    with fase(estadisticas, "malla"):
+        x = np.arange(x0, x_final + h, h)
+        y = np.zeros(len(x))
+        y[0] = y0
+        k1s = y_preds = k2s = None
+        if etapas:
+            k1s, y_preds, k2s = (np.empty(len(x) - 1) for _ in range(3))
+    
+    with fase(estadisticas, "pasos"):
+        _pasos_euler(f, x, y, h, k1s, y_preds, k2s, callback)
     
+    if estadisticas is not None:
+        estadisticas.iteraciones = len(x) - 1
+    if etapas:
+        return x, y, k1s, y_preds, k2s
+    return x, y
+
+
+def _pasos_euler(f, x, y, h, k1s, y_preds, k2s, callback):
+    """Llena y (y las etapas, si no son None) sobre la malla x (en su lugar)."""
     for i in range(0, len(x) - 1):
         k1 = f(x[i], y[i])
         y_pred = y[i] + h * k1
         k2 = f(x[i+1], y_pred)
         y[i+1] = y[i] + (h / 2) * (k1 + k2)
+        if k1s is not None:
+            k1s[i], y_preds[i], k2s[i] = k1, y_pred, k2
+        if callback is not None:
+            callback(i + 1, x[i+1], y[i+1])
+
+
+def numero_de_puntos(x0, h, x_final):
+    """Número de puntos de la malla de euler_mejorado (igual que np.arange)."""
+    return int(np.ceil((x_final + h - x0) / h))
+
+
+def euler_mejorado_por_bloques(f, x0, y0, h, x_final, tam_bloque=100000, estadisticas=None):
+    """
+    Versión por bloques de euler_mejorado para trayectorias muy largas.
+
+    Genera tuplas (x, y) de a lo más tam_bloque puntos sin construir nunca
+    la malla completa, así que la memoria usada no depende del número de
+    pasos. Concatenar los bloques da el mismo resultado que euler_mejorado.
+
+    Con estadisticas se cuentan las evaluaciones de f y se acumula el tiempo
+    de las fases malla y pasos de cada bloque (sin el tiempo de quien consume
+    los bloques); iteraciones es el número de pasos ya dados.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    n = numero_de_puntos(x0, h, x_final)
+    # np.arange calcula sus puntos como x0 + i * ((x0 + h) - x0)
+    delta = (x0 + h) - x0
+    y_i = y0
+    
+    for inicio in range(0, n, tam_bloque):
+        fin = min(inicio + tam_bloque, n)
+        with fase(estadisticas, "malla"):
+            # Un punto extra: el último paso del bloque necesita x[i+1]
+            x = x0 + delta * np.arange(inicio, fin + 1)
+            y = np.empty(fin - inicio)
+        
+        with fase(estadisticas, "pasos"):
+            for j in range(fin - inicio):
+                y[j] = y_i
+                if inicio + j + 1 < n:
+                    k1 = f(x[j], y_i)
+                    y_pred = y_i + h * k1
+                    k2 = f(x[j+1], y_pred)
+                    y_i = y_i + (h / 2) * (k1 + k2)
+        if estadisticas is not None:
+            estadisticas.iteraciones = min(fin, n - 1)
+        
+        yield x[:-1], y
+
+
+def euler_mejorado_lote(f, x0, y0, h, x_final, estadisticas=None):
+    """
+    Resuelve muchos problemas dy/dx = f(x, y) a la vez con Euler Mejorado.
+
+    x0, y0 y h pueden ser escalares o arreglos (se combinan con broadcasting);
+    f debe aceptar arreglos de NumPy. Todas las trayectorias avanzan juntas,
+    una operación vectorizada por paso.
+
+    Regresa x, y con forma (n_problemas, n_pasos + 1). Si los problemas tienen
+    distinto número de pasos, las posiciones sobrantes quedan en NaN.
+
+    Con estadisticas se cuentan las llamadas (vectorizadas) a f y se mide el
+    tiempo de las fases malla, pasos y salida (marcar las posiciones
+    sobrantes); iteraciones es el número de pasos del problema más largo.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    x0, y0, h = np.broadcast_arrays(
+        np.asarray(x0, dtype=float), np.asarray(y0, dtype=float), np.asarray(h, dtype=float)
+    )
+    x0, y0, h = x0.ravel(), y0.ravel(), h.ravel()
+    
+    with fase(estadisticas, "malla"):
+        # Mismo número de puntos que np.arange(x0, x_final + h, h)
+        pasos = np.ceil((x_final + h - x0) / h).astype(int) - 1
+        n_pasos = int(pasos.max())
         
+        # Mismos puntos que np.arange: x0 + i * ((x0 + h) - x0)
+        x = x0[:, None] + ((x0 + h) - x0)[:, None] * np.arange(n_pasos + 1)
+        y = np.full(x.shape, np.nan)
+        y[:, 0] = y0
+    
+    with fase(estadisticas, "pasos"):
+        y_i = y0.copy()
+        for i in range(n_pasos):
+            activos = i < pasos
+            k1 = f(x[:, i], y_i)
+            y_pred = y_i + h * k1
+            k2 = f(x[:, i+1], y_pred)
+            y_i = y_i + (h / 2) * (k1 + k2)
+            y[:, i+1] = np.where(activos, y_i, np.nan)
+    
+    with fase(estadisticas, "salida"):
+        x[np.arange(n_pasos + 1) > pasos[:, None]] = np.nan
+    if estadisticas is not None:
+        estadisticas.iteraciones = n_pasos
     return x, y
@@ -0,0 +1,125 @@
+from functools import lru_cache
+
+import numpy as np
+
+# SymPy se importa dentro de cada función: importar este módulo (y los
+# métodos que lo usan) sólo requiere NumPy hasta que se compila una ecuación.
+
+# Número máximo de expresiones distintas que se conservan en cada caché
+TAM_CACHE = 256
+
+
+def normalizar(texto):
+    """Normaliza el texto de una ecuación: '^' como potencia y sin espacios."""
+    return "".join(texto.replace("^", "**").split())
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def _parsear(texto):
+    import sympy as sp
+    return sp.sympify(texto)
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def _compilar(expr, variables):
+    import sympy as sp
+    simbolos = sp.symbols(variables)
+    if not expr.free_symbols & set(simbolos):
+        # lambdify regresa un escalar para expresiones constantes;
+        # lo extendemos a la forma de los argumentos para poder evaluar arreglos
+        valor = float(expr) if expr.is_real else complex(expr)
+
+        def constante(*args):
+            forma = np.broadcast(*args).shape
+            return valor if forma == () else np.full(forma, valor)
+
+        return constante
+    return sp.lambdify(simbolos, expr, 'numpy')
+
+
+def expresion(texto):
+    """Regresa la expresión de SymPy para el texto dado (con caché)."""
+    return _parsear(normalizar(texto))
+
+
+def compilar(texto, variables=('x', 'y')):
+    """
+    Convierte el texto de una ecuación en una función de NumPy.
+
+    El resultado se guarda en una caché LRU indexada por la expresión
+    normalizada y la firma de variables, así que volver a compilar la misma
+    ecuación no vuelve a llamar a sympify ni a lambdify.
+    """
+    return _compilar(expresion(texto), tuple(variables))
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def _derivar(expr, variable, orden):
+    import sympy as sp
+    return sp.diff(expr, sp.Symbol(variable), orden)
+
+
+def compilar_expresion(expr, variables=('x', 'y')):
+    """Como compilar(), pero a partir de una expresión de SymPy ya construida."""
+    return _compilar(expr, tuple(variables))
+
+
+def compilar_derivada(texto, variable='x', variables=None, orden=1):
+    """
+    Compila la derivada de orden `orden` de la ecuación respecto a `variable`.
+
+    La derivada se calcula simbólicamente una sola vez por expresión y se
+    guarda en la misma caché que compilar().
+    """
+    if variables is None:
+        variables = (variable,)
+    return _compilar(_derivar(expresion(texto), variable, orden), tuple(variables))
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def _compilar_sistema(exprs, variables, jacobiano):
+    import sympy as sp
+    simbolos = sp.symbols(variables)
+    matriz = sp.Matrix(exprs)
+    if jacobiano:
+        matriz = matriz.jacobian(simbolos)
+    forma = matriz.shape if jacobiano else (len(exprs),)
+    # Una sola función que recibe el vector completo de incógnitas
+    funcion = sp.lambdify([simbolos], matriz, 'numpy')
+
+    def evaluar(X):
+        return np.asarray(funcion(X), dtype=float).reshape(forma)
+
+    return evaluar
+
+
+def compilar_sistema(textos, variables):
+    """
+    Compila un sistema F(X) = 0 dado como lista de ecuaciones de texto.
+
+    La función resultante recibe el vector X (en el orden de `variables`) y
+    regresa un arreglo con los valores de las ecuaciones.
+    """
+    return _compilar_sistema(tuple(expresion(t) for t in textos), tuple(variables), False)
+
+
+def compilar_jacobiano(textos, variables):
+    """Compila la matriz jacobiana del sistema (calculada con SymPy)."""
+    return _compilar_sistema(tuple(expresion(t) for t in textos), tuple(variables), True)
+
+
+def estadisticas_cache():
+    """Aciertos, fallos y tamaño de las cachés de parseo y compilación."""
+    return {
+        "parseo": _parsear.cache_info()._asdict(),
+        "derivacion": _derivar.cache_info()._asdict(),
+        "compilacion": _compilar.cache_info()._asdict(),
+        "sistemas": _compilar_sistema.cache_info()._asdict(),
+    }
+
+
+def limpiar_cache():
+    _parsear.cache_clear()
+    _derivar.cache_clear()
+    _compilar.cache_clear()
+    _compilar_sistema.cache_clear()
@@ -0,0 +1,46 @@
+import numpy as np
+
+# Puntos a partir de los cuales una trayectoria se reduce antes de graficar
+# (unos dos por píxel en una figura de 10 pulgadas a 100 dpi)
+MAX_PUNTOS = 2000
+# Sólo se dibujan marcadores si la gráfica tiene a lo más estos puntos
+MAX_PUNTOS_CON_MARCADORES = 60
+
+
+def reducir_puntos(x, y, n_max=MAX_PUNTOS):
+    """
+    Reduce una trayectoria a lo más n_max puntos conservando su forma.
+
+    Divide los puntos interiores en (n_max - 2) // 2 grupos consecutivos (los
+    que sobran se agregan al último) y de cada grupo conserva el mínimo y el
+    máximo de y (en su orden original), así que los picos y valles siguen
+    apareciendo en la gráfica. El primer y el último punto siempre se
+    conservan. Los NaN se ignoran al buscar el mínimo y el máximo; un grupo
+    sólo de NaN conserva su primer punto. Lanza ValueError si n_max < 4.
+    """
+    if n_max < 4:
+        raise ValueError("n_max debe ser al menos 4.")
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+    if n <= n_max:
+        return x, y
+
+    grupos = (n_max - 2) // 2
+    tam = (n - 2) // grupos
+    # NaN nunca es el mínimo ni el máximo de un grupo
+    y_min = np.where(np.isnan(y), np.inf, y)
+    y_max = np.where(np.isnan(y), -np.inf, y)
+
+    # Grupos completos salvo el último, que se extiende hasta el penúltimo punto
+    fin = 1 + (grupos - 1) * tam
+    base = 1 + tam * np.arange(grupos - 1)
+    i_min = np.append(base + np.argmin(y_min[1:fin].reshape(grupos - 1, tam), axis=1),
+                      fin + np.argmin(y_min[fin:n - 1]))
+    i_max = np.append(base + np.argmax(y_max[1:fin].reshape(grupos - 1, tam), axis=1),
+                      fin + np.argmax(y_max[fin:n - 1]))
+
+    indices = np.unique(np.concatenate(([0], i_min, i_max, [n - 1])))
+    if len(indices) > n_max:
+        raise RuntimeError(f"reducir_puntos regresó {len(indices)} puntos (máximo {n_max}).")
+    return x[indices], y[indices]
@@ -0,0 +1,54 @@
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+
+@dataclass
+class Estadisticas:
+    """
+    Resultados de instrumentación de una corrida de un método.
+
+    Se pasa como argumento `estadisticas` a los métodos y éstos la llenan con
+    el número de evaluaciones de f y f', el tiempo de cada fase y, en los
+    métodos de raíces, el estado final. Las fases de las ecuaciones
+    diferenciales son malla (reservar la malla y los arreglos), pasos y
+    salida (armar los arreglos que se regresan a partir de los calculados).
+    """
+    evaluaciones_f: int = 0
+    evaluaciones_df: int = 0
+    iteraciones: int = 0
+    tiempos: dict = field(default_factory=dict)
+    estado: Optional[int] = None
+    mensaje: str = ""
+
+    @contextmanager
+    def fase(self, nombre):
+        """Acumula en tiempos[nombre] el tiempo transcurrido dentro del bloque."""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + time.perf_counter() - inicio
+
+    def a_dict(self):
+        return asdict(self)
+
+    def a_json(self, **kwargs):
+        return json.dumps(self.a_dict(), **kwargs)
+
+
+def contar(f, estadisticas, campo="evaluaciones_f"):
+    """Envuelve f para que cada llamada incremente estadisticas.<campo>."""
+    def f_contada(*args):
+        setattr(estadisticas, campo, getattr(estadisticas, campo) + 1)
+        return f(*args)
+    return f_contada
+
+
+def fase(estadisticas, nombre):
+    """Contexto que mide la fase si hay estadísticas y no hace nada si no."""
+    if estadisticas is None:
+        return nullcontext()
+    return estadisticas.fase(nombre)
@@ -0,0 +1,219 @@
+"""
+Ejecución por lotes, sin interfaz ni gráficas, de trabajos definidos en un
+archivo JSON o CSV.
+
+Cada trabajo indica el método ("euler_mejorado", "runge_kutta4",
+"trapecio_implicito" o "newton_raphson"), la ecuación y sus parámetros:
+
+    [
+      {"id": "e1", "metodo": "euler_mejorado", "ecuacion": "x + 2*y",
+       "x0": 0, "y0": 1, "h": 0.1, "x_final": 2},
+      {"id": "n1", "metodo": "newton_raphson", "ecuacion": "x**2 - 4",
+       "x0": 3, "tol": 1e-7, "max_iter": 1000}
+    ]
+
+En Euler Mejorado y Runge-Kutta 4, "cada": N guarda sólo uno de cada N
+puntos de la trayectoria. En CSV las columnas son las mismas llaves. Uso:
+
+    python -m metodos_numericos.lote trabajos.json --salida resultados --formato npz
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from metodos_numericos.euler_mejorado import euler_mejorado
+from metodos_numericos.runge_kutta4 import runge_kutta4
+from metodos_numericos.trapecio_implicito import trapecio_implicito
+from metodos_numericos.newton_raphson import newton_raphson, CONVERGIO
+from metodos_numericos.expresiones import compilar, compilar_derivada
+from metodos_numericos.instrumentacion import Estadisticas
+from metodos_numericos.almacenamiento import guardar_columnas
+from metodos_numericos import cache_resultados
+
+CAMPOS_NUMERICOS = {
+    "x0": float, "y0": float, "h": float, "x_final": float, "tol": float, "max_iter": int, "cada": int,
+}
+CAMPOS_RESUMEN = ["id", "metodo", "ecuacion", "estado", "resultado", "mensaje", "tiempo_s", "archivo"]
+
+
+def leer_trabajos(ruta):
+    """Lee la lista de trabajos de un archivo .json o .csv."""
+    if ruta.endswith(".csv"):
+        with open(ruta, encoding="utf-8", newline="") as archivo:
+            trabajos = [
+                {llave: valor for llave, valor in fila.items() if valor not in (None, "")}
+                for fila in csv.DictReader(archivo)
+            ]
+    else:
+        with open(ruta, encoding="utf-8") as archivo:
+            trabajos = json.load(archivo)
+        if isinstance(trabajos, dict):
+            trabajos = trabajos["trabajos"]
+
+    for i, trabajo in enumerate(trabajos):
+        trabajo.setdefault("id", str(i))
+        preparar_trabajo(trabajo)
+    return trabajos
+
+
+def preparar_trabajo(trabajo):
+    """Convierte los campos numéricos de un trabajo (pueden venir como texto)."""
+    for campo, tipo in CAMPOS_NUMERICOS.items():
+        if campo in trabajo:
+            trabajo[campo] = tipo(trabajo[campo])
+    return trabajo
+
+
+def resolver_trabajo(trabajo, callback=None):
+    """
+    Resuelve un trabajo y regresa (columnas, estado, resultado, mensaje).
+
+    columnas es la tabla de resultados por columnas: la trayectoria para
+    las ecuaciones diferenciales y las iteraciones para Newton-Raphson.
+    callback se pasa tal cual al método (recibe el índice del paso como
+    primer argumento).
+    """
+    metodo = trabajo["metodo"]
+    ecuacion = trabajo["ecuacion"]
+
+    if metodo == "euler_mejorado":
+        f = compilar(ecuacion, ('x', 'y'))
+        x, y, k1, y_pred, k2 = euler_mejorado(
+            f, trabajo["x0"], trabajo["y0"], trabajo["h"], trabajo["x_final"], etapas=True,
+            callback=callback, cada=trabajo.get("cada", 1),
+        )
+        columnas = {
+            "x": x, "y": y,
+            "k1": np.append(k1, np.nan), "y*": np.append(y_pred, np.nan), "k2": np.append(k2, np.nan),
+        }
+        return columnas, "ok", float(y[-1]), ""
+
+    if metodo == "runge_kutta4":
+        f = compilar(ecuacion, ('x', 'y'))
+        x, y, k1, k2, k3, k4 = runge_kutta4(
+            f, trabajo["x0"], trabajo["y0"], trabajo["x_final"], trabajo["h"], callback=callback,
+            cada=trabajo.get("cada", 1),
+        )
+        columnas = {"x": x, "y": y}
+        for nombre, k in (("k1", k1), ("k2", k2), ("k3", k3), ("k4", k4)):
+            columnas[nombre] = np.append(k, np.nan)
+        return columnas, "ok", float(y[-1]), ""
+
+    if metodo == "trapecio_implicito":
+        f = compilar(ecuacion, ('x', 'y'))
+        dfdy = compilar_derivada(ecuacion, 'y', ('x', 'y'))
+        x, y = trapecio_implicito(
+            f, dfdy, trabajo["x0"], trabajo["y0"], trabajo["h"], trabajo["x_final"], callback=callback
+        )
+        return {"x": x, "y": y}, "ok", float(y[-1]), ""
+
+    if metodo == "newton_raphson":
+        f = compilar(ecuacion, ('x',))
+        if "derivada" in trabajo:
+            df = compilar(trabajo["derivada"], ('x',))
+        else:
+            df = compilar_derivada(ecuacion, 'x')
+        estadisticas = Estadisticas()
+        raiz, iteraciones = newton_raphson(
+            f, df, trabajo["x0"], trabajo.get("tol", 1e-7), trabajo.get("max_iter", 1000),
+            estadisticas=estadisticas, callback=callback,
+        )
+        x_iter = np.array(iteraciones if iteraciones else [trabajo["x0"]], dtype=float)
+        columnas = {"i": np.arange(len(x_iter)), "x": x_iter, "f(x)": f(x_iter), "f'(x)": df(x_iter)}
+        estado = "ok" if estadisticas.estado == CONVERGIO else "sin_convergencia"
+        resultado = float("nan") if raiz is None else float(raiz)
+        return columnas, estado, resultado, estadisticas.mensaje
+
+    raise ValueError(f"Método desconocido: {metodo}")
+
+
+def resolver_trabajo_en_cache(trabajo, callback=None):
+    """
+    Como resolver_trabajo, pero consulta primero la caché persistente de
+    resultados (cache_resultados) y guarda ahí los resultados nuevos. Un
+    error de la caché cuenta como resultado no guardado: el trabajo se
+    resuelve igual.
+    """
+    if not cache_resultados.HABILITADA:
+        return resolver_trabajo(trabajo, callback)
+    try:
+        guardado = cache_resultados.obtener(trabajo)
+    except cache_resultados.ERRORES_CACHE:
+        guardado = None
+    if guardado is not None:
+        return guardado
+    columnas, estado, resultado, mensaje = resolver_trabajo(trabajo, callback)
+    try:
+        cache_resultados.guardar(trabajo, columnas, estado, resultado, mensaje)
+    except cache_resultados.ERRORES_CACHE:
+        pass
+    return columnas, estado, resultado, mensaje
+
+
+def ejecutar_trabajo(trabajo, directorio, formato, cache=True):
+    """Resuelve un trabajo, guarda su tabla y regresa su fila de resumen."""
+    inicio = time.perf_counter()
+    fila = {"id": trabajo["id"], "metodo": trabajo.get("metodo"), "ecuacion": trabajo.get("ecuacion")}
+    try:
+        resolver = resolver_trabajo_en_cache if cache else resolver_trabajo
+        columnas, estado, resultado, mensaje = resolver(trabajo)
+        archivo = guardar_columnas(os.path.join(directorio, str(trabajo["id"])), columnas, formato)
+        fila.update(estado=estado, resultado=resultado, mensaje=mensaje, archivo=os.path.basename(archivo))
+    except Exception as e:
+        fila.update(estado="error", resultado=float("nan"), mensaje=str(e), archivo="")
+    fila["tiempo_s"] = time.perf_counter() - inicio
+    return fila
+
+
+def ejecutar_lote(trabajos, directorio, formato="csv", procesos=None, cache=True):
+    """
+    Ejecuta los trabajos en paralelo y escribe `resumen.csv` en directorio.
+
+    Cada trabajo guarda su tabla en `<id>.<formato>`. Con cache=True los
+    resultados se toman de (y se guardan en) la caché persistente. Regresa
+    las filas del resumen en el orden de los trabajos.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        resumen = list(ejecutor.map(
+            ejecutar_trabajo, trabajos, [directorio] * len(trabajos), [formato] * len(trabajos),
+            [cache] * len(trabajos),
+            chunksize=max(1, len(trabajos) // (4 * (procesos or os.cpu_count() or 1))),
+        ))
+
+    with open(os.path.join(directorio, "resumen.csv"), "w", encoding="utf-8", newline="") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS_RESUMEN)
+        escritor.writeheader()
+        escritor.writerows(resumen)
+    return resumen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Ejecuta por lotes trabajos de Euler Mejorado, Runge-Kutta 4, trapecio implícito y Newton-Raphson."
+    )
+    parser.add_argument("trabajos", help="Archivo .json o .csv con los trabajos.")
+    parser.add_argument("--salida", default="resultados", help="Directorio de salida.")
+    parser.add_argument("--formato", choices=["csv", "npz", "parquet"], default="csv")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos en paralelo (por defecto, uno por núcleo).")
+    parser.add_argument("--sin-cache", action="store_true", help="No usar la caché persistente de resultados.")
+    args = parser.parse_args(argv)
+
+    resumen = ejecutar_lote(
+        leer_trabajos(args.trabajos), args.salida, args.formato, args.procesos, cache=not args.sin_cache
+    )
+    errores = [fila for fila in resumen if fila["estado"] == "error"]
+    print(f"{len(resumen)} trabajos, {len(errores)} con error. Resumen en {os.path.join(args.salida, 'resumen.csv')}")
+    for fila in errores:
+        print(f"  {fila['id']}: {fila['mensaje']}", file=sys.stderr)
+    return 1 if errores else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
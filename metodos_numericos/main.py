@@ -1,8 +1,68 @@
+import os
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from euler_mejorado import euler_mejorado, mostrar_tabla as tabla_euler, mostrar_grafica as grafica_euler
-from runge_kutta4 import runge_kutta4, mostrar_tabla as tabla_rk4, mostrar_grafica as grafica_rk4
-from newton_raphson import newton_raphson, mostrar_tabla as tabla_nr, mostrar_grafica as grafica_nr
+
+# Permite ejecutar tanto `python metodos_numericos/main.py` como `python -m metodos_numericos.main`
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metodos_numericos.euler_mejorado import euler_mejorado
+from metodos_numericos.runge_kutta4 import runge_kutta4
+from metodos_numericos.newton_raphson import newton_raphson
+from metodos_numericos.instrumentacion import Estadisticas
+
+def tabla_euler(x, y):
+    """Imprime la tabla de resultados de Euler Mejorado"""
+    print(f"\n{'i':>5} {'x':>12} {'y':>20}")
+    for i in range(len(x)):
+        print(f"{i:>5} {x[i]:>12.4f} {y[i]:>20.10f}")
+
+def grafica_euler(x, y):
+    """Grafica la solución de Euler Mejorado"""
+    import matplotlib.pyplot as plt
+    plt.plot(x, y, 'r-o', linewidth=2, markersize=4)
+    plt.grid(True, alpha=0.3)
+    plt.xlabel('x')
+    plt.ylabel('y')
+    plt.title('Solución - Método de Euler Mejorado')
+    plt.show()
+
+def tabla_rk4(x, y, k1, k2, k3, k4):
+    """Imprime la tabla de resultados de Runge-Kutta 4"""
+    print(f"\n{'i':>5} {'x':>10} {'y':>16} {'k1':>14} {'k2':>14} {'k3':>14} {'k4':>14}")
+    for i in range(len(x) - 1):
+        print(f"{i:>5} {x[i]:>10.4f} {y[i]:>16.10f} {k1[i]:>14.8f} {k2[i]:>14.8f} {k3[i]:>14.8f} {k4[i]:>14.8f}")
+    print(f"{len(x) - 1:>5} {x[-1]:>10.4f} {y[-1]:>16.10f}")
+
+def grafica_rk4(x, y):
+    """Grafica la solución de Runge-Kutta 4"""
+    import matplotlib.pyplot as plt
+    plt.plot(x, y, 'b-o', linewidth=2, markersize=4)
+    plt.grid(True, alpha=0.3)
+    plt.xlabel('x')
+    plt.ylabel('y')
+    plt.title('Solución - Método de Runge-Kutta 4')
+    plt.show()
+
+def tabla_nr(iteraciones):
+    """Imprime las iteraciones de Newton-Raphson"""
+    print(f"\n{'i':>5} {'x':>20}")
+    for i, x in enumerate(iteraciones):
+        print(f"{i:>5} {x:>20.10f}")
+
+def grafica_nr(iteraciones, f, intervalo):
+    """Grafica f(x) y la raíz encontrada"""
+    import matplotlib.pyplot as plt
+    x_vals = np.linspace(intervalo[0], intervalo[1], 200)
+    plt.plot(x_vals, [f(xi) for xi in x_vals], 'g-', linewidth=2, label='f(x)')
+    plt.axhline(y=0, color='k', linestyle='--', alpha=0.3)
+    plt.plot(iteraciones[-1], 0, 'ro', markersize=10, label=f'Raíz = {iteraciones[-1]:.6f}')
+    plt.grid(True, alpha=0.3)
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.title('Método de Newton-Raphson')
+    plt.legend()
+    plt.show()
 
 def menu_principal():
     """Menú principal para seleccionar método"""
@@ -66,9 +126,9 @@ def metodo_runge_kutta():
         h = float(input("Paso (h): "))
         x_end = float(input("x final: "))
         
-        x, y, k1, k2, k3, k4, k = runge_kutta4(f, x0, y0, x_end, h)
+        x, y, k1, k2, k3, k4 = runge_kutta4(f, x0, y0, x_end, h)
         
-        tabla_rk4(x, y, k1, k2, k3, k4, k)
+        tabla_rk4(x, y, k1, k2, k3, k4)
         grafica_rk4(x, y)
     except Exception as e:
         print(f"\n Error: {str(e)}")
@@ -100,7 +160,9 @@ def metodo_newton_raphson():
         tol = float(input("Tolerancia (default 1e-7): ") or "1e-7")
         max_iter = int(input("Máximo de iteraciones (default 1000): ") or "1000")
         
-        raiz, iteraciones = newton_raphson(f, df, x0, tol, max_iter)
+        estadisticas = Estadisticas()
+        raiz, iteraciones = newton_raphson(f, df, x0, tol, max_iter, estadisticas=estadisticas)
+        print(estadisticas.mensaje)
         
         if raiz is not None:
             print(f"\nRaíz encontrada: {raiz:.10f}")
@@ -1,8 +1,48 @@
+import math
+
 import numpy as np
-import matplotlib.pyplot as plt
+from metodos_numericos.instrumentacion import contar, fase
+
+# Códigos de estado de los métodos de raíces
+CONVERGIO = 0
+DERIVADA_CERO = 1
+MAX_ITER = 2
+NO_FINITO = 3
+SIN_CAMBIO_DE_SIGNO = 4
+
+def newton_raphson(f, df, x0, tol=1e-7, max_iter=1000, estadisticas=None, callback=None):
+    """
+    Método de Newton-Raphson.
+
+    Si se pasa un objeto Estadisticas se cuentan las evaluaciones de f y f'
+    y se guardan el estado final (CONVERGIO, DERIVADA_CERO o MAX_ITER), su
+    mensaje y el número de iteraciones. callback(i, x) se llama con cada
+    nuevo iterado.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+        df = contar(df, estadisticas, "evaluaciones_df")
+    
+    with fase(estadisticas, "iteraciones"):
+        raiz, iteraciones, estado, mensaje = _newton_raphson(f, df, x0, tol, max_iter, callback)
+    
+    if estadisticas is not None:
+        estadisticas.estado = estado
+        estadisticas.mensaje = mensaje
+        estadisticas.iteraciones = len(iteraciones) - 1 if iteraciones else 0
+    return raiz, iteraciones
+
 
-def newton_raphson(f, df, x0, tol=1e-7, max_iter=1000):
-    """Método de Newton-Raphson"""
+def newton_raphson_estado(f, df, x0, tol=1e-7, max_iter=1000, callback=None):
+    """
+    Newton-Raphson sin Estadisticas: regresa (raiz, iteraciones, estado,
+    mensaje). Para usarlo dentro de otros métodos (por ejemplo, en cada paso
+    de un método implícito) sin el costo de contar evaluaciones.
+    """
+    return _newton_raphson(f, df, x0, tol, max_iter, callback)
+
+
+def _newton_raphson(f, df, x0, tol, max_iter, callback):
     x = x0
     iteraciones = [x0]
     
@@ -11,17 +51,432 @@ def newton_raphson(f, df, x0, tol=1e-7, max_iter=1000):
         dfx = df(x)
         
         if dfx == 0:
-            print("Derivada es cero. No se puede continuar.")
-            return None, None
+            return None, None, DERIVADA_CERO, "Derivada es cero. No se puede continuar."
         
         x_new = x - fx / dfx
         iteraciones.append(x_new)
+        if callback is not None:
+            callback(i + 1, x_new)
         
         if abs(x_new - x) < tol:
-            print(f"Convergencia alcanzada después de {i+1} iteraciones.")
-            return x_new, iteraciones
+            return x_new, iteraciones, CONVERGIO, f"Convergencia alcanzada después de {i+1} iteraciones."
         
         x = x_new
     
-    print("Número máximo de iteraciones alcanzado sin convergencia.")
-    return x, iteraciones
+    return x, iteraciones, MAX_ITER, "Número máximo de iteraciones alcanzado sin convergencia."
+
+
+def _iterar(paso, x0, tol, max_iter, callback):
+    """Ciclo común de los métodos de un punto: x_{n+1} = paso(x_n)."""
+    x = x0
+    iteraciones = [x0]
+    
+    for i in range(max_iter):
+        x_new = paso(x)
+        if x_new is None:
+            return None, None, DERIVADA_CERO, "Denominador cero. No se puede continuar."
+        
+        iteraciones.append(x_new)
+        if callback is not None:
+            callback(i + 1, x_new)
+        
+        if abs(x_new - x) < tol:
+            return x_new, iteraciones, CONVERGIO, f"Convergencia alcanzada después de {i+1} iteraciones."
+        
+        x = x_new
+    
+    return x, iteraciones, MAX_ITER, "Número máximo de iteraciones alcanzado sin convergencia."
+
+
+def _registrar(resultado, estadisticas):
+    raiz, iteraciones, estado, mensaje = resultado
+    if estadisticas is not None:
+        estadisticas.estado = estado
+        estadisticas.mensaje = mensaje
+        estadisticas.iteraciones = len(iteraciones) - 1 if iteraciones else 0
+    return raiz, iteraciones
+
+
+def householder(derivadas, x0, tol=1e-7, max_iter=1000, estadisticas=None, callback=None):
+    """
+    Método de Householder de orden d = len(derivadas) - 1.
+
+    derivadas es la lista [f, f', f'', ...]. El orden 1 es Newton-Raphson y
+    el orden 2 es Halley; el método de orden d converge con orden d + 1.
+    Cada iteración evalúa f y sus d derivadas una vez (en estadisticas las
+    derivadas se cuentan en evaluaciones_df). Lanza ValueError si no se da
+    al menos f'.
+    """
+    if len(derivadas) < 2:
+        raise ValueError("householder necesita al menos [f, f'] en derivadas.")
+    if estadisticas is not None:
+        derivadas = [contar(derivadas[0], estadisticas)] + [
+            contar(df, estadisticas, "evaluaciones_df") for df in derivadas[1:]
+        ]
+    d = len(derivadas) - 1
+    
+    def paso(x):
+        fk = [df(x) for df in derivadas]
+        if fk[0] == 0:
+            return x
+        # Derivadas de g = 1/f a partir de las de f (regla de Leibniz en f * g = 1)
+        g = [1 / fk[0]]
+        for n in range(1, d + 1):
+            g.append(-sum(math.comb(n, k) * fk[k] * g[n - k] for k in range(1, n + 1)) / fk[0])
+        if g[d] == 0:
+            return None
+        return x + d * g[d - 1] / g[d]
+    
+    with fase(estadisticas, "iteraciones"):
+        resultado = _iterar(paso, x0, tol, max_iter, callback)
+    return _registrar(resultado, estadisticas)
+
+
+def halley(f, df, d2f, x0, tol=1e-7, max_iter=1000, estadisticas=None, callback=None):
+    """Método de Halley (convergencia cúbica); usa f, f' y f''."""
+    return householder([f, df, d2f], x0, tol, max_iter, estadisticas, callback)
+
+
+def secante(f, x0, x1=None, tol=1e-7, max_iter=1000, estadisticas=None, callback=None):
+    """
+    Método de la secante: no necesita la derivada y usa una sola evaluación
+    de f por iteración. Si no se da x1 se toma un punto cercano a x0.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    if x1 is None:
+        x1 = x0 + 1e-4 * max(1.0, abs(x0))
+    
+    x_ant, f_ant = x1, f(x1)
+    
+    def paso(x):
+        nonlocal x_ant, f_ant
+        fx = f(x)
+        if fx == 0:
+            return x
+        if fx == f_ant:
+            return None
+        x_new = x - fx * (x - x_ant) / (fx - f_ant)
+        x_ant, f_ant = x, fx
+        return x_new
+    
+    with fase(estadisticas, "iteraciones"):
+        resultado = _iterar(paso, x0, tol, max_iter, callback)
+    return _registrar(resultado, estadisticas)
+
+
+def steffensen(f, x0, tol=1e-7, max_iter=1000, estadisticas=None, callback=None):
+    """
+    Método de Steffensen: convergencia cuadrática sin derivada, con dos
+    evaluaciones de f por iteración.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    
+    def paso(x):
+        fx = f(x)
+        if fx == 0:
+            return x
+        denominador = f(x + fx) - fx
+        if denominador == 0:
+            return None
+        return x - fx * fx / denominador
+    
+    with fase(estadisticas, "iteraciones"):
+        resultado = _iterar(paso, x0, tol, max_iter, callback)
+    return _registrar(resultado, estadisticas)
+
+
+def newton_raphson_seguro(f, df, a, b, tol=1e-7, max_iter=100, historial=True, estadisticas=None):
+    """
+    Newton-Raphson protegido con bisección sobre un intervalo [a, b].
+
+    f(a) y f(b) deben tener signos opuestos. Se da un paso de Newton cuando
+    cae dentro del intervalo que encierra la raíz y lo reduce lo suficiente;
+    si no (o si f'(x) = 0) se da un paso de bisección. Así la convergencia
+    está garantizada y nunca se usan más de 4 + 2 * max_iter evaluaciones
+    (f en los extremos, f y f' en el punto medio y f y f' en cada iteración).
+
+    Con historial=False no se guardan los iterados (memoria constante).
+    Regresa (raiz, iteraciones) como newton_raphson; iteraciones es None sin
+    historial. En estadisticas se guardan el estado (CONVERGIO, MAX_ITER o
+    SIN_CAMBIO_DE_SIGNO, con raiz None), su mensaje y las iteraciones.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+        df = contar(df, estadisticas, "evaluaciones_df")
+    
+    with fase(estadisticas, "iteraciones"):
+        raiz, iteraciones, estado, mensaje, n = _newton_raphson_seguro(f, df, a, b, tol, max_iter, historial)
+    
+    if estadisticas is not None:
+        estadisticas.estado = estado
+        estadisticas.mensaje = mensaje
+        estadisticas.iteraciones = n
+    return raiz, iteraciones
+
+
+def _newton_raphson_seguro(f, df, a, b, tol, max_iter, historial):
+    fa, fb = f(a), f(b)
+    if fa == 0:
+        return a, [a] if historial else None, CONVERGIO, "f es cero en el extremo a.", 0
+    if fb == 0:
+        return b, [b] if historial else None, CONVERGIO, "f es cero en el extremo b.", 0
+    if fa * fb > 0:
+        return None, None, SIN_CAMBIO_DE_SIGNO, "f(a) y f(b) tienen el mismo signo; el intervalo no encierra una raíz.", 0
+    
+    # Orientar el intervalo para que f(bajo) < 0 < f(alto)
+    bajo, alto = (a, b) if fa < 0 else (b, a)
+    x = (a + b) / 2
+    iteraciones = [x] if historial else None
+    dx_anterior = dx = abs(b - a)
+    fx, dfx = f(x), df(x)
+    
+    for i in range(max_iter):
+        fuera = ((x - alto) * dfx - fx) * ((x - bajo) * dfx - fx) > 0
+        lento = abs(2 * fx) > abs(dx_anterior * dfx)
+        dx_anterior = dx
+        if fuera or lento:
+            dx = (alto - bajo) / 2
+            x = bajo + dx
+        else:
+            dx = fx / dfx
+            x = x - dx
+        if historial:
+            iteraciones.append(x)
+        
+        if abs(dx) < tol:
+            return x, iteraciones, CONVERGIO, f"Convergencia alcanzada después de {i+1} iteraciones.", i + 1
+        
+        fx, dfx = f(x), df(x)
+        if fx == 0:
+            return x, iteraciones, CONVERGIO, f"Convergencia alcanzada después de {i+1} iteraciones.", i + 1
+        if fx < 0:
+            bajo = x
+        else:
+            alto = x
+    
+    return x, iteraciones, MAX_ITER, "Número máximo de iteraciones alcanzado sin convergencia.", max_iter
+
+
+def newton_raphson_multiple(f, df, x0, tol=1e-7, max_iter=1000):
+    """
+    Newton-Raphson vectorizado sobre un arreglo de valores iniciales.
+
+    f y df deben aceptar arreglos de NumPy. x0 puede ser real o complejo
+    (útil para mapas de cuencas de atracción de polinomios). En cada
+    iteración sólo se actualizan los puntos que siguen activos; los que
+    convergen o tienen derivada cero se retiran.
+
+    Regresa tres arreglos con la forma de x0: raíces, número de iteraciones
+    y código de estado (CONVERGIO, DERIVADA_CERO, MAX_ITER o NO_FINITO).
+    """
+    x0 = np.asarray(x0)
+    x = x0.astype(np.result_type(x0.dtype, float)).ravel()
+    iteraciones = np.zeros(x.size, dtype=int)
+    estados = np.full(x.size, MAX_ITER, dtype=np.int8)
+    activos = np.arange(x.size)
+    
+    for _ in range(max_iter):
+        if activos.size == 0:
+            break
+        
+        x_act = x[activos]
+        fx = f(x_act)
+        dfx = df(x_act)
+        
+        cero = dfx == 0
+        x_new = x_act - fx / np.where(cero, 1, dfx)
+        no_finito = ~cero & ~np.isfinite(x_new)
+        convergio = ~cero & ~no_finito & (np.abs(x_new - x_act) < tol)
+        
+        avanza = ~cero
+        iteraciones[activos[avanza]] += 1
+        x[activos[avanza]] = x_new[avanza]
+        estados[activos[cero]] = DERIVADA_CERO
+        estados[activos[no_finito]] = NO_FINITO
+        estados[activos[convergio]] = CONVERGIO
+        
+        activos = activos[~(cero | no_finito | convergio)]
+    
+    return x.reshape(x0.shape), iteraciones.reshape(x0.shape), estados.reshape(x0.shape)
+
+
+def raices_unicas(raices, estados=None, tol=1e-6):
+    """
+    Elimina raíces repetidas (a distancia menor o igual que tol) de un
+    arreglo. Las raíces se regresan redondeadas a tol / 1000.
+
+    Si se pasan los estados de newton_raphson_multiple, sólo se consideran
+    los puntos que convergieron.
+    """
+    raices = np.asarray(raices).ravel()
+    if estados is not None:
+        raices = raices[np.asarray(estados).ravel() == CONVERGIO]
+    if raices.size == 0:
+        return raices
+    
+    # El redondeo (a tol / 1000) sólo junta de antemano las copias casi
+    # idénticas; la comparación con tol se hace después, sin redondear a tol
+    decimales = max(0, int(np.ceil(-np.log10(tol)))) + 3
+    candidatas = np.unique(np.round(raices, decimales))
+    
+    # Cada candidata se compara con todas las raíces ya conservadas: en el
+    # orden de np.unique (por parte real y luego imaginaria) dos copias de la
+    # misma raíz compleja pueden quedar separadas por otra raíz
+    unicas = np.empty(0, dtype=candidatas.dtype)
+    for r in candidatas:
+        if np.all(np.abs(r - unicas) > tol):
+            unicas = np.append(unicas, r)
+    return unicas
+
+
+# Si una iteración con un jacobiano viejo no reduce el residuo al menos en
+# este factor, se vuelve a calcular y factorizar el jacobiano
+CONTRACCION_MINIMA = 0.5
+
+def _lu_factorizar(A):
+    """Factorización LU con pivoteo parcial; regresa (LU compacta, permutación)."""
+    A = np.array(A, dtype=float)
+    n = len(A)
+    permutacion = np.arange(n)
+    for k in range(n):
+        p = k + np.argmax(np.abs(A[k:, k]))
+        if A[p, k] == 0:
+            raise np.linalg.LinAlgError("Matriz singular")
+        if p != k:
+            A[[k, p]] = A[[p, k]]
+            permutacion[[k, p]] = permutacion[[p, k]]
+        A[k+1:, k] /= A[k, k]
+        A[k+1:, k+1:] -= np.outer(A[k+1:, k], A[k, k+1:])
+    return A, permutacion
+
+
+def _lu_resolver(lu, b):
+    """Resuelve A x = b con la factorización de _lu_factorizar, en O(n²)."""
+    A, permutacion = lu
+    x = np.array(b, dtype=float)[permutacion]
+    n = len(x)
+    for i in range(1, n):
+        x[i] -= A[i, :i] @ x[:i]
+    for i in range(n - 1, -1, -1):
+        x[i] = (x[i] - A[i, i+1:] @ x[i+1:]) / A[i, i]
+    return x
+
+
+def _factorizador():
+    """Regresa (factorizar, resolver): SciPy/LAPACK si está instalado, si no la LU propia."""
+    try:
+        from scipy.linalg import lu_factor, lu_solve
+    except ImportError:
+        return _lu_factorizar, _lu_resolver
+    
+    def factorizar(A):
+        lu = lu_factor(A, check_finite=False)
+        if np.any(np.diag(lu[0]) == 0):
+            raise np.linalg.LinAlgError("Matriz singular")
+        return lu
+    
+    return factorizar, lambda lu, b: lu_solve(lu, b, check_finite=False)
+
+
+def jacobiano_diferencias(F, X, FX=None):
+    """Jacobiano de F en X por diferencias hacia adelante (n evaluaciones de F)."""
+    X = np.asarray(X, dtype=float)
+    if FX is None:
+        FX = np.asarray(F(X), dtype=float)
+    J = np.empty((len(FX), len(X)))
+    for j in range(len(X)):
+        h = np.sqrt(np.finfo(float).eps) * max(abs(X[j]), 1.0)
+        X_h = X.copy()
+        X_h[j] += h
+        J[:, j] = (np.asarray(F(X_h), dtype=float) - FX) / h
+    return J
+
+
+def newton_raphson_sistema(F, X0, J=None, tol=1e-8, max_iter=100, metodo="newton", reusar=1,
+                           estadisticas=None, callback=None):
+    """
+    Método de Newton-Raphson para sistemas F(X) = 0.
+
+    J(X) regresa la matriz jacobiana (por ejemplo, de compilar_jacobiano);
+    si no se da, se aproxima por diferencias finitas. Métodos:
+
+    - "newton": factoriza (LU) el jacobiano cada `reusar` iteraciones. Con
+      reusar=1 es Newton; con reusar > 1 es Shamanskii y las iteraciones
+      intermedias sólo resuelven con la LU ya calculada, en O(n²).
+    - "cuerda": conserva la LU del jacobiano inicial.
+    - "broyden": cuasi-Newton; parte de la inversa del jacobiano inicial y la
+      corrige con actualizaciones de rango uno, en O(n²) por iteración.
+
+    En los tres casos, si una iteración no reduce el residuo al menos en
+    CONTRACCION_MINIMA se vuelve a calcular el jacobiano. En estadisticas
+    las evaluaciones de J se cuentan en evaluaciones_df.
+
+    Regresa (raiz, iteraciones) como newton_raphson; raiz es None si el
+    jacobiano es singular o F deja de ser finita.
+    """
+    if metodo not in ("newton", "cuerda", "broyden"):
+        raise ValueError(f"Método desconocido: {metodo}")
+    if estadisticas is not None:
+        F = contar(F, estadisticas)
+        if J is not None:
+            J = contar(J, estadisticas, "evaluaciones_df")
+    
+    with fase(estadisticas, "iteraciones"):
+        resultado = _newton_raphson_sistema(F, X0, J, tol, max_iter, metodo, reusar, estadisticas, callback)
+    return _registrar(resultado, estadisticas)
+
+
+def _newton_raphson_sistema(F, X0, J, tol, max_iter, metodo, reusar, estadisticas, callback):
+    factorizar, resolver = _factorizador()
+    X = np.array(X0, dtype=float)
+    FX = np.asarray(F(X), dtype=float)
+    iteraciones = [X]
+    actualizar = True
+    edad = 0
+    
+    for i in range(max_iter):
+        if not np.all(np.isfinite(FX)):
+            return None, None, NO_FINITO, "F(X) no es finita. No se puede continuar."
+        
+        if actualizar:
+            with fase(estadisticas, "jacobiano"):
+                JX = J(X) if J is not None else jacobiano_diferencias(F, X, FX)
+            try:
+                with fase(estadisticas, "factorizacion"):
+                    lu = factorizar(JX)
+                    if metodo == "broyden":
+                        H = resolver(lu, np.eye(len(X)))
+            except np.linalg.LinAlgError:
+                return None, None, DERIVADA_CERO, "Jacobiano singular. No se puede continuar."
+            actualizar = False
+            edad = 0
+        
+        paso = -(H @ FX) if metodo == "broyden" else -resolver(lu, FX)
+        X_new = X + paso
+        FX_new = np.asarray(F(X_new), dtype=float)
+        edad += 1
+        iteraciones.append(X_new)
+        if callback is not None:
+            callback(i + 1, X_new)
+        
+        if np.max(np.abs(paso)) < tol:
+            return X_new, iteraciones, CONVERGIO, f"Convergencia alcanzada después de {i+1} iteraciones."
+        
+        if metodo == "broyden":
+            # Actualización de Broyden ("buena") de la inversa (Sherman-Morrison)
+            H_y = H @ (FX_new - FX)
+            denominador = paso @ H_y
+            if denominador != 0:
+                H += np.outer(paso - H_y, paso @ H) / denominador
+            else:
+                actualizar = True
+        elif metodo == "newton" and edad >= reusar:
+            actualizar = True
+        if np.linalg.norm(FX_new) > CONTRACCION_MINIMA * np.linalg.norm(FX):
+            actualizar = True
+        
+        X, FX = X_new, FX_new
+    
+    return X, iteraciones, MAX_ITER, "Número máximo de iteraciones alcanzado sin convergencia."
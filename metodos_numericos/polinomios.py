@@ -0,0 +1,152 @@
+"""
+Raíces de polinomios: todas a la vez con la iteración de Aberth-Ehrlich.
+
+La iteración actualiza todas las aproximaciones de todos los polinomios en
+operaciones de arreglos de NumPy, con el polinomio y su derivada evaluados
+por Horner. Así se obtienen todas las raíces (reales y complejas) en unas
+cuantas iteraciones, sin tener que elegir un x0 por raíz.
+"""
+import numpy as np
+
+from metodos_numericos.expresiones import expresion
+
+
+def coeficientes(texto, variable='x'):
+    """
+    Regresa los coeficientes (del grado mayor al menor) si la ecuación es un
+    polinomio en `variable` con coeficientes numéricos, o None si no lo es.
+    """
+    import sympy as sp
+    expr = expresion(texto)
+    simbolo = sp.Symbol(variable)
+    if expr.free_symbols - {simbolo}:
+        return None
+    try:
+        polinomio = sp.Poly(expr, simbolo)
+    except sp.PolynomialError:
+        return None
+    if polinomio.degree() < 1:
+        return None
+    try:
+        coef = np.array([complex(c) for c in polinomio.all_coeffs()])
+    except TypeError:
+        return None
+    return coef.real if np.all(coef.imag == 0) else coef
+
+
+def horner(coef, z):
+    """
+    Evalúa p(z) y p'(z) por Horner.
+
+    coef tiene forma (..., n+1) y z forma (..., m): cada fila de z se evalúa
+    con la fila correspondiente de coef.
+    """
+    coef = np.asarray(coef)
+    p = np.broadcast_to(coef[..., :1], z.shape).astype(np.result_type(coef, z))
+    dp = np.zeros_like(p)
+    for i in range(1, coef.shape[-1]):
+        dp = dp * z + p
+        p = p * z + coef[..., i:i + 1]
+    return p, dp
+
+
+def _iniciales(coef):
+    """Aproximaciones iniciales en un círculo que contiene todas las raíces."""
+    n = coef.shape[-1] - 1
+    k = np.arange(1, n + 1)
+    # Cota de Fujiwara para el módulo de las raíces de un polinomio mónico
+    radio = 2 * np.max(np.abs(coef[:, 1:]) ** (1 / k), axis=1)
+    radio = np.where(radio > 0, radio, 1.0)
+    centro = -coef[:, 1] / n
+    angulos = 2 * np.pi * np.arange(n) / n + 0.4
+    return centro[:, None] + 0.5 * radio[:, None] * np.exp(1j * angulos)
+
+
+def aberth(coef, tol=1e-12, max_iter=100):
+    """
+    Todas las raíces de varios polinomios del mismo grado a la vez.
+
+    coef tiene forma (m, n+1) o (n+1,), con el coeficiente principal
+    distinto de cero. Regresa (raices, iteraciones, convergio): las raíces
+    como arreglo complejo (m, n) y, por polinomio, las iteraciones usadas y
+    si todas sus raíces cumplieron la tolerancia relativa.
+    """
+    coef = np.asarray(coef)
+    un_polinomio = coef.ndim == 1
+    coef = np.atleast_2d(coef).astype(complex)
+    coef = coef / coef[:, :1]
+    m, n = coef.shape[0], coef.shape[1] - 1
+
+    if n == 1:
+        raices = -coef[:, 1:]
+        iteraciones = np.zeros(m, dtype=int)
+        convergio = np.ones(m, dtype=bool)
+    else:
+        raices = _iniciales(coef)
+        iteraciones = np.zeros(m, dtype=int)
+        convergio = np.zeros(m, dtype=bool)
+        diagonal = np.eye(n, dtype=bool)
+        for _ in range(max_iter):
+            activos = ~convergio
+            if not activos.any():
+                break
+            z = raices[activos]
+            p, dp = horner(coef[activos], z)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cociente = p / dp
+                diferencias = z[:, :, None] - z[:, None, :]
+                diferencias[:, diagonal] = np.inf
+                suma = np.sum(1 / diferencias, axis=2)
+                correccion = cociente / (1 - cociente * suma)
+            # Raíz exacta (p = 0) o derivada nula: esa aproximación no se mueve
+            correccion = np.where(np.isfinite(correccion), correccion, 0)
+            raices[activos] = z - correccion
+            iteraciones[activos] += 1
+            listos = np.all(np.abs(correccion) <= tol * np.maximum(np.abs(z), 1), axis=1)
+            convergio[np.flatnonzero(activos)[listos]] = True
+
+    if un_polinomio:
+        return raices[0], iteraciones[0], convergio[0]
+    return raices, iteraciones, convergio
+
+
+def _limpiar(raices, tol):
+    """Hace reales las raíces con parte imaginaria despreciable y las ordena."""
+    reales = np.abs(raices.imag) <= tol * np.maximum(np.abs(raices), 1)
+    raices = np.where(reales, raices.real + 0j, raices)
+    return raices[np.lexsort((raices.imag, raices.real))]
+
+
+def raices_polinomio(coef, tol=1e-12, max_iter=100):
+    """
+    Todas las raíces de un polinomio dado por sus coeficientes (grado mayor
+    primero). Regresa (raices, convergio); las raíces reales tienen parte
+    imaginaria cero y vienen ordenadas por parte real.
+    """
+    coef = np.trim_zeros(np.asarray(coef), 'f')
+    if len(coef) < 2:
+        return np.empty(0, dtype=complex), True
+    raices, _, convergio = aberth(coef, tol, max_iter)
+    return _limpiar(raices, np.sqrt(tol)), bool(convergio)
+
+
+def raices_polinomios(lista_coef, tol=1e-12, max_iter=100):
+    """
+    Como raices_polinomio, pero para muchos polinomios en una sola llamada.
+
+    Los polinomios se agrupan por grado y cada grupo se resuelve con una
+    sola iteración de Aberth vectorizada. Regresa una lista de
+    (raices, convergio) en el orden de entrada.
+    """
+    lista_coef = [np.trim_zeros(np.asarray(c), 'f') for c in lista_coef]
+    resultados = [(np.empty(0, dtype=complex), True)] * len(lista_coef)
+    grupos = {}
+    for i, coef in enumerate(lista_coef):
+        if len(coef) >= 2:
+            grupos.setdefault(len(coef), []).append(i)
+
+    for indices in grupos.values():
+        raices, _, convergio = aberth(np.array([lista_coef[i] for i in indices]), tol, max_iter)
+        for j, i in enumerate(indices):
+            resultados[i] = (_limpiar(raices[j], np.sqrt(tol)), bool(convergio[j]))
+    return resultados
@@ -1,27 +1,211 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from metodos_numericos.instrumentacion import contar, fase
+from metodos_numericos.salida import integrar_muestreado
 
 
-def runge_kutta4(f, x0, y0, x_final, h):
-    # Generamos los puntos de x (usamos linspace para evitar errores de precisión en el stop)
+def runge_kutta4(f, x0, y0, x_final, h, estadisticas=None, callback=None, etapas=True, cada=1,
+                 solo_final=False, dtype=np.float64):
+    """
+    Resuelve dy/dx = f(x, y) con y(x0) = y0 usando Runge-Kutta 4.
+
+    y0 puede ser un escalar o un vector de dimensión d (sistema Y' = F(x, Y)).
+    En el caso vectorial y tiene forma (pasos + 1, d) y k1..k4 forma (pasos, d).
+
+    Controles de salida (no cambian la aritmética de los pasos):
+    etapas=False no guarda k1..k4 y regresa sólo (x, y); cada=N guarda uno
+    de cada N puntos (más el último) y las etapas de los pasos que salen de
+    ellos; solo_final=True guarda sólo el último punto; dtype (p. ej.
+    np.float32) es el tipo de y y de las etapas guardadas.
+
+    Si se pasa un objeto Estadisticas se cuentan las evaluaciones de f y se
+    mide el tiempo de cada fase (malla, pasos y, si se guarda sólo parte de
+    la trayectoria, salida). callback(i, x, y), si se da, se llama después
+    de calcular cada punto nuevo.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    
     pasos = int(round((x_final - x0) / h))
-    x = np.linspace(x0, x_final, pasos + 1)
-    y = np.zeros(len(x))
-    y[0] = y0
+    # Sin etapas también se usa el camino por bloques: k1..k4 sólo ocupan búferes de un bloque
+    if not etapas or cada != 1 or solo_final or np.dtype(dtype) != np.float64:
+        n = pasos + 1
+        
+        def x_en(indices):
+            return _puntos_linspace(x0, x_final, n, indices)
+        
+        def pasos_bloque(x, y, k, callback):
+            _pasos_rk4(f, x, y, h, *k, callback)
+        
+        x, y, k = integrar_muestreado(
+            pasos_bloque, x_en, n, y0, 4, etapas, cada, solo_final, dtype, callback, estadisticas=estadisticas
+        )
+        if estadisticas is not None:
+            estadisticas.iteraciones = pasos
+        return (x, y, *k) if etapas else (x, y)
     
-    k1_list, k2_list, k3_list, k4_list = [], [], [], []
+    with fase(estadisticas, "malla"):
+        # Generamos los puntos de x (usamos linspace para evitar errores de precisión en el stop)
+        x = np.linspace(x0, x_final, pasos + 1)
+        y0 = np.asarray(y0, dtype=float)
+        
+        # Estado y etapas en arreglos contiguos reservados de antemano
+        y = np.empty((pasos + 1,) + y0.shape)
+        k1, k2, k3, k4 = (np.empty((pasos,) + y0.shape) for _ in range(4))
+        y[0] = y0
+    
+    with fase(estadisticas, "pasos"):
+        _pasos_rk4(f, x, y, h, k1, k2, k3, k4, callback)
+    
+    if estadisticas is not None:
+        estadisticas.iteraciones = pasos
+    return x, y, k1, k2, k3, k4
+
+
+def _pasos_rk4(f, x, y, h, k1, k2, k3, k4, callback):
+    """Llena y y las etapas k1..k4 sobre la malla x (en su lugar)."""
+    pasos = len(x) - 1
+    if y.ndim == 1:
+        for i in range(pasos):
+            k1[i] = f(x[i], y[i])
+            k2[i] = f(x[i] + h/2, y[i] + (h/2) * k1[i])
+            k3[i] = f(x[i] + h/2, y[i] + (h/2) * k2[i])
+            k4[i] = f(x[i] + h, y[i] + h * k3[i])
+            
+            y[i+1] = y[i] + (h / 6) * (k1[i] + 2*k2[i] + 2*k3[i] + k4[i])
+            if callback is not None:
+                callback(i + 1, x[i+1], y[i+1])
+    else:
+        # Búfer reutilizado para el estado de cada etapa: sin reservas por paso
+        y_etapa = np.empty(y.shape[1:])
+        for i in range(pasos):
+            k1[i] = f(x[i], y[i])
+            np.multiply(k1[i], h/2, out=y_etapa)
+            y_etapa += y[i]
+            k2[i] = f(x[i] + h/2, y_etapa)
+            np.multiply(k2[i], h/2, out=y_etapa)
+            y_etapa += y[i]
+            k3[i] = f(x[i] + h/2, y_etapa)
+            np.multiply(k3[i], h, out=y_etapa)
+            y_etapa += y[i]
+            k4[i] = f(x[i] + h, y_etapa)
+            
+            np.add(k2[i], k3[i], out=y_etapa)
+            y_etapa *= 2
+            y_etapa += k1[i]
+            y_etapa += k4[i]
+            y_etapa *= h / 6
+            np.add(y[i], y_etapa, out=y[i+1])
+            if callback is not None:
+                callback(i + 1, x[i+1], y[i+1])
+
+
+def _puntos_linspace(x0, x_final, n, indices):
+    """Puntos indices de linspace(x0, x_final, n), sin construir la malla completa."""
+    x = x0 + (x_final - x0) / max(n - 1, 1) * indices
+    # linspace fija el último punto en x_final
+    x[indices == n - 1] = x_final
+    return x
+
+
+def numero_de_puntos(x0, h, x_final):
+    """Número de puntos de la malla de runge_kutta4."""
+    return int(round((x_final - x0) / h)) + 1
+
+
+def runge_kutta4_por_bloques(f, x0, y0, x_final, h, tam_bloque=100000, etapas=False, estadisticas=None):
+    """
+    Versión por bloques de runge_kutta4 para trayectorias muy largas.
+
+    Genera tuplas (x, y) de a lo más tam_bloque puntos, o (x, y, k1, k2, k3, k4)
+    si etapas=True, sin construir nunca la malla completa. La fila i de las
+    etapas corresponde al paso de x[i] a x[i+1]; la última fila de la
+    trayectoria queda en NaN. y0 puede ser escalar o vector.
+
+    Con estadisticas se cuentan las evaluaciones de f y se acumula el tiempo
+    de las fases malla y pasos de cada bloque (sin el tiempo de quien consume
+    los bloques); iteraciones es el número de pasos ya dados.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    n = numero_de_puntos(x0, h, x_final)
+    y_i = np.asarray(y0, dtype=float)
     
-    for i in range(len(x) - 1):
-        k1 = f(x[i], y[i])
-        k2 = f(x[i] + h/2, y[i] + (h/2) * k1)
-        k3 = f(x[i] + h/2, y[i] + (h/2) * k2)
-        k4 = f(x[i] + h, y[i] + h * k3)
+    for inicio in range(0, n, tam_bloque):
+        fin = min(inicio + tam_bloque, n)
+        with fase(estadisticas, "malla"):
+            x = _puntos_linspace(x0, x_final, n, np.arange(inicio, fin))
+            y = np.empty((fin - inicio,) + y_i.shape)
+            if etapas:
+                k = np.full((4, fin - inicio) + y_i.shape, np.nan)
+        
+        with fase(estadisticas, "pasos"):
+            for j in range(fin - inicio):
+                y[j] = y_i
+                if inicio + j + 1 < n:
+                    k1 = f(x[j], y_i)
+                    k2 = f(x[j] + h/2, y_i + (h/2) * k1)
+                    k3 = f(x[j] + h/2, y_i + (h/2) * k2)
+                    k4 = f(x[j] + h, y_i + h * k3)
+                    if etapas:
+                        k[:, j] = k1, k2, k3, k4
+                    y_i = y_i + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+        if estadisticas is not None:
+            estadisticas.iteraciones = min(fin, n - 1)
         
-        k1_list.append(k1)
-        k2_list.append(k2)
-        k3_list.append(k3)
-        k4_list.append(k4)
+        if etapas:
+            yield (x, y) + tuple(k)
+        else:
+            yield x, y
+
+
+def runge_kutta4_lote(f, x0, y0, x_final, h, estadisticas=None):
+    """
+    Resuelve muchos problemas dy/dx = f(x, y) a la vez con Runge-Kutta 4.
+
+    x0, y0 y h pueden ser escalares o arreglos (se combinan con broadcasting);
+    f debe aceptar arreglos de NumPy. Todas las trayectorias avanzan juntas,
+    una operación vectorizada por paso.
+
+    Regresa x, y con forma (n_problemas, n_pasos + 1). Si los problemas tienen
+    distinto número de pasos, las posiciones sobrantes quedan en NaN.
+
+    Con estadisticas se cuentan las llamadas (vectorizadas) a f y se mide el
+    tiempo de las fases malla, pasos y salida (marcar las posiciones
+    sobrantes); iteraciones es el número de pasos del problema más largo.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+    x0, y0, h = np.broadcast_arrays(
+        np.asarray(x0, dtype=float), np.asarray(y0, dtype=float), np.asarray(h, dtype=float)
+    )
+    x0, y0, h = x0.ravel(), y0.ravel(), h.ravel()
+    
+    with fase(estadisticas, "malla"):
+        pasos = np.round((x_final - x0) / h).astype(int)
+        n_pasos = int(pasos.max())
         
-        y[i+1] = y[i] + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+        # Mismo espaciado que linspace(x0, x_final, pasos + 1) en cada problema
+        dx = (x_final - x0) / np.maximum(pasos, 1)
+        x = x0[:, None] + dx[:, None] * np.arange(n_pasos + 1)
+        # linspace fija el último punto en x_final
+        x[np.arange(pasos.size), pasos] = x_final
+        y = np.full(x.shape, np.nan)
+        y[:, 0] = y0
+    
+    with fase(estadisticas, "pasos"):
+        y_i = y0.copy()
+        for i in range(n_pasos):
+            activos = i < pasos
+            x_i = x0 + i * dx
+            k1 = f(x_i, y_i)
+            k2 = f(x_i + h/2, y_i + (h/2) * k1)
+            k3 = f(x_i + h/2, y_i + (h/2) * k2)
+            k4 = f(x_i + h, y_i + h * k3)
+            y_i = y_i + (h / 6) * (k1 + 2*k2 + 2*k3 + k4)
+            y[:, i+1] = np.where(activos, y_i, np.nan)
     
-    return x, y, k1_list, k2_list, k3_list, k4_list
+    with fase(estadisticas, "salida"):
+        x[np.arange(n_pasos + 1) > pasos[:, None]] = np.nan
+    if estadisticas is not None:
+        estadisticas.iteraciones = n_pasos
+    return x, y
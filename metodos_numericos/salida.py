@@ -0,0 +1,98 @@
+"""
+Controles de salida comunes a euler_mejorado y runge_kutta4: guardar sólo
+uno de cada `cada` puntos, sólo el punto final, sin etapas o en otro dtype.
+
+Los pasos se calculan por bloques de TAM_BLOQUE en búferes float64 con el
+mismo ciclo del método, así que la aritmética no cambia; sólo se copian a la
+salida los puntos pedidos.
+"""
+import numpy as np
+
+from metodos_numericos.instrumentacion import fase
+
+# Pasos por bloque de trabajo (memoria auxiliar constante)
+TAM_BLOQUE = 4096
+
+
+def puntos_guardados(n, cada=1, solo_final=False):
+    """Número de puntos guardados de una malla de n: 0, cada, 2*cada, ... y el último."""
+    if cada < 1:
+        raise ValueError("cada debe ser un entero mayor o igual a 1.")
+    if solo_final:
+        return 1
+    return len(range(0, n, cada)) + (1 if (n - 1) % cada else 0)
+
+
+def _seleccion(inicio, fin, n, cada, solo_final):
+    """Índices, relativos a inicio, de los puntos guardados en [inicio, fin]."""
+    if solo_final:
+        indices = np.arange(0)
+    else:
+        indices = np.arange(-(-inicio // cada) * cada, fin + 1, cada)
+    if fin == n - 1 and (len(indices) == 0 or indices[-1] != n - 1):
+        indices = np.append(indices, n - 1)
+    return indices - inicio
+
+
+def integrar_muestreado(pasos, x_en, n, y0, n_etapas, etapas=True, cada=1, solo_final=False,
+                        dtype=np.float64, callback=None, tam_bloque=TAM_BLOQUE,
+                        estadisticas=None):
+    """
+    Avanza un método de un paso sobre una malla de n puntos guardando sólo
+    0, cada, 2*cada, ... y el último punto (o sólo el último con solo_final).
+
+    pasos(x, y, etapas, callback) llena y[1:] a partir de y[0] sobre los
+    puntos x de un bloque, y las n_etapas etapas de cada paso. x_en(indices)
+    regresa los valores de x de la malla. callback recibe índices globales.
+
+    Regresa (x, y, lista de etapas): las etapas guardadas son las de los
+    pasos que salen de un punto guardado (o None si etapas=False). x se
+    conserva en float64; y y las etapas se guardan en dtype. Aparte de la
+    salida sólo se usan búferes de un bloque. Con estadisticas se miden las
+    fases malla, pasos y salida (copiar los puntos guardados).
+    """
+    y0 = np.asarray(y0, dtype=float)
+    total = puntos_guardados(n, cada, solo_final)
+
+    with fase(estadisticas, "malla"):
+        x = np.empty(total)
+        y = np.empty((total,) + y0.shape, dtype=dtype)
+        salida_etapas = [np.empty((total - 1,) + y0.shape, dtype=dtype) for _ in range(n_etapas)] if etapas else None
+        pos = pos_etapa = 0
+        if not solo_final or n == 1:
+            x[0] = x_en(np.arange(1))[0]
+            y[0] = y0
+            pos = 1
+
+        m_max = min(tam_bloque, n - 1)
+        y_bloque = np.empty((m_max + 1,) + y0.shape)
+        k_bloque = [np.empty((m_max,) + y0.shape) for _ in range(n_etapas)]
+        y_bloque[0] = y0
+
+    for inicio in range(0, n - 1, tam_bloque):
+        fin = min(inicio + tam_bloque, n - 1)
+        m = fin - inicio
+        cb = None
+        if callback is not None:
+            def cb(i, x_i, y_i, inicio=inicio):
+                callback(inicio + i, x_i, y_i)
+        with fase(estadisticas, "pasos"):
+            x_bloque = x_en(np.arange(inicio, fin + 1))
+            pasos(x_bloque, y_bloque[:m + 1], [k[:m] for k in k_bloque], cb)
+
+        with fase(estadisticas, "salida"):
+            seleccion = _seleccion(inicio, fin, n, cada, solo_final)
+            # Puntos guardados en (inicio, fin]; el punto inicio ya se guardó en el bloque anterior
+            puntos = seleccion[seleccion > 0]
+            x[pos:pos + len(puntos)] = x_bloque[puntos]
+            y[pos:pos + len(puntos)] = y_bloque[puntos]
+            pos += len(puntos)
+            if etapas:
+                # Etapas de los pasos que salen de un punto guardado en [inicio, fin)
+                pasos_guardados = seleccion[seleccion < m]
+                for salida, k in zip(salida_etapas, k_bloque):
+                    salida[pos_etapa:pos_etapa + len(pasos_guardados)] = k[pasos_guardados]
+                pos_etapa += len(pasos_guardados)
+        y_bloque[0] = y_bloque[m]
+
+    return x, y, salida_etapas
@@ -0,0 +1,309 @@
+"""
+Servicio HTTP/JSON local para resolver trabajos sin bloquear a quien los pide.
+
+Los trabajos tienen el mismo formato que en metodos_numericos.lote y se
+resuelven en un grupo de procesos. La cola de espera es acotada: si está
+llena, el servicio responde 503 de inmediato en lugar de acumular trabajo.
+Cada trabajo puede traer un plazo ("plazo_s", en segundos): si vence en la
+cola se descarta y si vence mientras corre, el trabajador lo interrumpe.
+Los trabajos de más de MAX_PASOS pasos se rechazan con 400.
+
+    POST /trabajos        encola un trabajo; responde 202 con su id (409 si
+                          trae un "id" que ya está en uso)
+    GET  /trabajos/<id>   estado del trabajo (y sus columnas al terminar)
+    POST /resolver        encola y espera el resultado (504 si vence el plazo)
+    GET  /salud           tamaño de la cola y trabajos en ejecución
+
+Uso:
+
+    python -m metodos_numericos.servicio --puerto 8000 --procesos 4 --cola 64
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+import urllib.request
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from metodos_numericos.lote import preparar_trabajo, resolver_trabajo_en_cache
+
+# Trabajos que pueden esperar en la cola antes de responder 503
+TAM_COLA = 64
+# Plazo (segundos) de los trabajos que no indican uno
+PLAZO = 60.0
+# Número de trabajos terminados cuyo resultado se conserva para consultarlo
+MAX_GUARDADOS = 1000
+# Tamaño máximo del cuerpo de una petición (bytes)
+MAX_CUERPO = 1 << 20
+# El trabajador revisa el plazo cada tantos pasos o iteraciones
+REVISAR_CADA = 1024
+# Pasos (o iteraciones de Newton-Raphson) máximos por trabajo: la trayectoria
+# completa se guarda en memoria y se devuelve en JSON
+MAX_PASOS = 1_000_000
+
+MENSAJES_HTTP = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    409: "Conflict", 413: "Payload Too Large", 503: "Service Unavailable", 504: "Gateway Timeout",
+}
+
+
+class PlazoVencido(Exception):
+    pass
+
+
+class IdEnUso(Exception):
+    pass
+
+
+def _a_lista(valores):
+    """Convierte un arreglo a lista para JSON (NaN e infinitos como null)."""
+    valores = np.asarray(valores, dtype=float)
+    lista = valores.astype(object)
+    lista[~np.isfinite(valores)] = None
+    return lista.tolist()
+
+
+def revisar_tamano(trabajo):
+    """Lanza ValueError si el trabajo pide más de MAX_PASOS pasos o iteraciones."""
+    if trabajo.get("metodo") == "newton_raphson":
+        pasos = trabajo.get("max_iter", 1000)
+    elif "h" in trabajo:
+        h = trabajo["h"]
+        if not h > 0:
+            raise ValueError("h debe ser positivo.")
+        pasos = abs(trabajo.get("x_final", 0.0) - trabajo.get("x0", 0.0)) / h
+    else:
+        return
+    if not pasos <= MAX_PASOS:
+        raise ValueError(f"El trabajo pide {pasos:.3g} pasos; el máximo es {MAX_PASOS}.")
+
+
+def _ejecutar(trabajo, limite):
+    """Se ejecuta en el proceso trabajador; limite es la hora (time.time()) del plazo."""
+    def revisar_plazo(i, *args):
+        if i % REVISAR_CADA == 0 and time.time() > limite:
+            raise PlazoVencido()
+
+    inicio = time.perf_counter()
+    try:
+        columnas, estado, resultado, mensaje = resolver_trabajo_en_cache(trabajo, revisar_plazo)
+    except PlazoVencido:
+        return {"estado": "vencido", "mensaje": "Se agotó el plazo durante la ejecución."}
+    except Exception as e:
+        return {"estado": "error", "mensaje": str(e)}
+    return {
+        "estado": estado,
+        "resultado": resultado if np.isfinite(resultado) else None,
+        "mensaje": mensaje,
+        "tiempo_s": time.perf_counter() - inicio,
+        "columnas": {nombre: _a_lista(valores) for nombre, valores in columnas.items()},
+    }
+
+
+class Servicio:
+    """
+    Cola acotada de trabajos atendida por `procesos` tareas, cada una con a
+    lo más un trabajo en el grupo de procesos a la vez.
+    """
+
+    def __init__(self, procesos=None, tam_cola=TAM_COLA, plazo=PLAZO):
+        self.procesos = procesos or os.cpu_count() or 1
+        self.plazo = plazo
+        self.cola = asyncio.Queue(maxsize=tam_cola)
+        self.trabajos = OrderedDict()
+        self.ejecutando = 0
+        self.ejecutor = None
+        self.tareas = []
+
+    async def iniciar(self):
+        self.ejecutor = ProcessPoolExecutor(max_workers=self.procesos)
+        self.tareas = [asyncio.create_task(self._atender()) for _ in range(self.procesos)]
+
+    async def detener(self):
+        for tarea in self.tareas:
+            tarea.cancel()
+        await asyncio.gather(*self.tareas, return_exceptions=True)
+        self.ejecutor.shutdown(cancel_futures=True)
+
+    def encolar(self, trabajo, plazo=None):
+        """
+        Registra y encola un trabajo; regresa su registro o None si la cola
+        está llena. Lanza IdEnUso si el trabajo trae un id que ya tiene
+        registro (en cola, ejecutándose o con resultado guardado).
+        """
+        plazo = self.plazo if plazo is None else plazo
+        if trabajo.get("id") and str(trabajo["id"]) in self.trabajos:
+            raise IdEnUso(str(trabajo["id"]))
+        registro = {
+            "id": str(trabajo.get("id") or uuid.uuid4().hex),
+            "estado": "en_cola",
+            "limite": time.time() + plazo,
+            "terminado": asyncio.Event(),
+        }
+        trabajo["id"] = registro["id"]
+        try:
+            self.cola.put_nowait((registro, trabajo))
+        except asyncio.QueueFull:
+            return None
+        self.trabajos[registro["id"]] = registro
+        while len(self.trabajos) > MAX_GUARDADOS + self.cola.maxsize + self.procesos:
+            self.trabajos.popitem(last=False)
+        return registro
+
+    async def _atender(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            registro, trabajo = await self.cola.get()
+            try:
+                if time.time() > registro["limite"]:
+                    registro.update(estado="vencido", mensaje="Se agotó el plazo en la cola.")
+                    continue
+                registro["estado"] = "ejecutando"
+                self.ejecutando += 1
+                try:
+                    registro.update(await loop.run_in_executor(self.ejecutor, _ejecutar, trabajo, registro["limite"]))
+                except Exception as e:
+                    registro.update(estado="error", mensaje=str(e))
+                finally:
+                    self.ejecutando -= 1
+            finally:
+                registro["terminado"].set()
+                self.cola.task_done()
+
+    def salud(self):
+        return {"en_cola": self.cola.qsize(), "tam_cola": self.cola.maxsize,
+                "ejecutando": self.ejecutando, "procesos": self.procesos}
+
+    async def atender_peticion(self, metodo, ruta, cuerpo):
+        """Regresa (código HTTP, respuesta) para una petición ya leída."""
+        if ruta == "/salud" and metodo == "GET":
+            return 200, self.salud()
+
+        if ruta.startswith("/trabajos/") and metodo == "GET":
+            registro = self.trabajos.get(ruta[len("/trabajos/"):])
+            if registro is None:
+                return 404, {"mensaje": "Trabajo desconocido."}
+            return 200, _publico(registro)
+
+        if ruta in ("/trabajos", "/resolver") and metodo == "POST":
+            try:
+                trabajo = preparar_trabajo(json.loads(cuerpo))
+                plazo = float(trabajo.pop("plazo_s", self.plazo))
+                if trabajo.get("metodo") is None or trabajo.get("ecuacion") is None:
+                    raise ValueError("El trabajo debe indicar 'metodo' y 'ecuacion'.")
+                revisar_tamano(trabajo)
+            except (ValueError, TypeError, AttributeError) as e:
+                return 400, {"mensaje": str(e)}
+            try:
+                registro = self.encolar(trabajo, plazo)
+            except IdEnUso as e:
+                return 409, {"mensaje": f"Ya existe un trabajo con id {e}; usa otro id o ninguno."}
+            if registro is None:
+                return 503, {"mensaje": "Cola llena; intenta más tarde.", **self.salud()}
+            if ruta == "/trabajos":
+                return 202, _publico(registro)
+
+            try:
+                espera = max(0.0, registro["limite"] - time.time())
+                await asyncio.wait_for(asyncio.shield(registro["terminado"].wait()), espera)
+            except asyncio.TimeoutError:
+                return 504, _publico(registro)
+            return 200, _publico(registro)
+
+        if ruta in ("/salud", "/trabajos", "/resolver") or ruta.startswith("/trabajos/"):
+            return 405, {"mensaje": f"Método {metodo} no permitido en {ruta}."}
+        return 404, {"mensaje": f"Ruta desconocida: {ruta}"}
+
+    async def conexion(self, lector, escritor):
+        """Atiende una conexión HTTP/1.1 (una petición por conexión)."""
+        try:
+            linea = (await lector.readline()).decode("latin-1").split()
+            if len(linea) < 2:
+                return
+            metodo, ruta = linea[0], linea[1].split("?")[0]
+            largo = 0
+            while True:
+                encabezado = (await lector.readline()).decode("latin-1").strip()
+                if not encabezado:
+                    break
+                nombre, _, valor = encabezado.partition(":")
+                if nombre.strip().lower() == "content-length":
+                    largo = int(valor)
+
+            if largo > MAX_CUERPO:
+                codigo, respuesta = 413, {"mensaje": "Cuerpo demasiado grande."}
+            else:
+                cuerpo = await lector.readexactly(largo) if largo else b""
+                codigo, respuesta = await self.atender_peticion(metodo, ruta, cuerpo)
+
+            datos = json.dumps(respuesta, ensure_ascii=False).encode("utf-8")
+            encabezados = [
+                f"HTTP/1.1 {codigo} {MENSAJES_HTTP[codigo]}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(datos)}",
+                "Connection: close",
+            ]
+            if codigo == 503:
+                encabezados.append("Retry-After: 1")
+            escritor.write(("\r\n".join(encabezados) + "\r\n\r\n").encode("latin-1") + datos)
+            await escritor.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+
+def _publico(registro):
+    """Campos del registro que se devuelven al cliente."""
+    return {llave: valor for llave, valor in registro.items() if llave not in ("limite", "terminado")}
+
+
+async def servir(host="127.0.0.1", puerto=8000, procesos=None, tam_cola=TAM_COLA, plazo=PLAZO):
+    servicio = Servicio(procesos, tam_cola, plazo)
+    await servicio.iniciar()
+    servidor = await asyncio.start_server(servicio.conexion, host, puerto)
+    print(f"Servicio en http://{host}:{puerto} ({servicio.procesos} procesos, cola de {tam_cola})")
+    try:
+        async with servidor:
+            await servidor.serve_forever()
+    finally:
+        await servicio.detener()
+
+
+def resolver_remoto(url, trabajo, plazo=PLAZO):
+    """
+    Cliente: envía un trabajo a POST <url>/resolver y regresa la respuesta.
+
+    Lanza urllib.error.HTTPError si el servicio responde 503 (cola llena),
+    504 (plazo vencido), 409 (id ya en uso) o un error de la petición.
+    """
+    datos = json.dumps({**trabajo, "plazo_s": plazo}).encode("utf-8")
+    peticion = urllib.request.Request(
+        url.rstrip("/") + "/resolver", data=datos, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(peticion, timeout=plazo + 5) as respuesta:
+        return json.load(respuesta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP/JSON para resolver trabajos en un grupo de procesos.")
+    parser.add_argument("--host", default=os.environ.get("METODOS_HOST", "127.0.0.1"))
+    parser.add_argument("--puerto", type=int, default=int(os.environ.get("METODOS_PUERTO", 8000)))
+    parser.add_argument("--procesos", type=int, default=os.environ.get("METODOS_PROCESOS"),
+                        help="Trabajos simultáneos (por defecto, uno por núcleo).")
+    parser.add_argument("--cola", type=int, default=TAM_COLA, help="Trabajos en espera antes de responder 503.")
+    parser.add_argument("--plazo", type=float, default=PLAZO, help="Plazo por defecto de cada trabajo (segundos).")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(servir(args.host, args.puerto, args.procesos, args.cola, args.plazo))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
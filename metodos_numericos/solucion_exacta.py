@@ -0,0 +1,109 @@
+import multiprocessing
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from metodos_numericos.expresiones import compilar_expresion, normalizar
+
+# Tiempo máximo (segundos) que se espera a sp.dsolve antes de cancelarlo
+TIEMPO_LIMITE = 5.0
+# Número máximo de procesos trabajadores resolviendo a la vez
+PROCESOS_MAX = 2
+# Número máximo de soluciones (o "sin solución") guardadas
+TAM_CACHE = 256
+
+_cache = OrderedDict()
+_candado = threading.Lock()
+_trabajadores = threading.BoundedSemaphore(PROCESOS_MAX)
+_contexto = None
+
+
+def _resolver(ecuacion, x0, y0, conexion):
+    """Se ejecuta en el proceso trabajador; envía srepr(solución) o None."""
+    import sympy as sp
+    try:
+        x_sym = sp.symbols('x')
+        y_sym = sp.Function('y')(x_sym)
+
+        # Parsear la expresión con y como función de x
+        f_sym = sp.sympify(ecuacion, locals={'x': x_sym, 'y': y_sym})
+
+        # Resolver dy/dx = f(x, y) con condición inicial
+        diffeq = sp.Eq(y_sym.diff(x_sym), f_sym)
+        sol = sp.dsolve(diffeq, y_sym, ics={y_sym.subs(x_sym, x0): y0})
+        conexion.send(None if isinstance(sol, list) else sp.srepr(sol.rhs))
+    except Exception:
+        conexion.send(None)
+    finally:
+        conexion.close()
+
+
+def _obtener_contexto():
+    global _contexto
+    if _contexto is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            # El servidor ya tiene SymPy importado: cada trabajador arranca rápido
+            _contexto = multiprocessing.get_context("forkserver")
+            _contexto.set_forkserver_preload(["sympy"])
+        else:
+            _contexto = multiprocessing.get_context("spawn")
+    return _contexto
+
+
+def _resolver_en_trabajador(ecuacion, x0, y0, tiempo_limite):
+    """Corre _resolver en otro proceso y lo termina si excede el tiempo límite."""
+    contexto = _obtener_contexto()
+    with _trabajadores:
+        receptor, emisor = contexto.Pipe(duplex=False)
+        proceso = contexto.Process(target=_resolver, args=(ecuacion, x0, y0, emisor), daemon=True)
+        proceso.start()
+        emisor.close()
+        try:
+            if receptor.poll(tiempo_limite):
+                return receptor.recv()
+            return None
+        except EOFError:
+            return None
+        finally:
+            if proceso.is_alive():
+                proceso.terminate()
+            proceso.join()
+            receptor.close()
+
+
+def resolver_con_sympy(ecuacion_str, x0, y0, tiempo_limite=TIEMPO_LIMITE):
+    """
+    Intenta resolver la ODE analíticamente usando SymPy.
+
+    sp.dsolve corre en un proceso trabajador que se cancela si tarda más de
+    tiempo_limite segundos. El resultado se guarda por (ecuación, x0, y0),
+    incluyendo los casos sin solución cerrada o que excedieron el tiempo.
+
+    Regresa una función vectorizada de x con la solución, o None.
+    """
+    clave = (normalizar(ecuacion_str), float(x0), float(y0))
+    with _candado:
+        if clave in _cache:
+            _cache.move_to_end(clave)
+            solucion = _cache[clave]
+            return None if solucion is None else compilar_expresion(solucion, ('x',))
+
+    texto = _resolver_en_trabajador(clave[0], clave[1], clave[2], tiempo_limite)
+    solucion = None
+    if texto is not None:
+        import sympy as sp
+        solucion = sp.sympify(texto)
+        # Validar que la solución se pueda evaluar con NumPy
+        try:
+            if not np.isfinite(float(compilar_expresion(solucion, ('x',))(clave[1]))):
+                solucion = None
+        except Exception:
+            solucion = None
+
+    with _candado:
+        _cache[clave] = solucion
+        if len(_cache) > TAM_CACHE:
+            _cache.popitem(last=False)
+
+    return None if solucion is None else compilar_expresion(solucion, ('x',))
@@ -0,0 +1,134 @@
+"""
+Regla del trapecio implícita (TR-BDF2) para ecuaciones diferenciales rígidas.
+
+Euler Mejorado es la versión explícita (predictor-corrector) de la regla
+del trapecio. Aquí cada paso tiene dos etapas implícitas, resueltas con
+Newton-Raphson: la regla del trapecio hasta x[i] + γh,
+
+    G1(z) = z - y[i] - γh/2 * (f(x[i], y[i]) + f(x[i] + γh, z)) = 0,
+
+y la fórmula BDF2 que usa y[i] y ese punto intermedio y_γ,
+
+    G2(z) = z - (y_γ - (1 - γ)² y[i]) / (γ(2 - γ)) - h(1 - γ)/(2 - γ) * f(x[i+1], z) = 0,
+
+con γ = 2 - √2. Ambas etapas tienen G'(z) = 1 - γh/2 * ∂f/∂y.
+
+La regla del trapecio sola es A-estable pero no L-estable: con h * ∂f/∂y
+muy negativo amortigua los modos rápidos con factor cercano a -1 y la
+solución oscila (en y' = -1000*(y - cos(x)), y(0) = 0, con h = 0.1 da
+y(2) ≈ -0.865 en lugar de -0.415). TR-BDF2 es L-estable y de segundo
+orden: esos modos se amortiguan en un paso, así que el paso lo limita la
+precisión de la parte lenta de la solución y no la estabilidad.
+"""
+import math
+
+import numpy as np
+
+from metodos_numericos.instrumentacion import contar, fase
+from metodos_numericos.newton_raphson import newton_raphson_estado, CONVERGIO
+
+# |h * ∂f/∂y| máximo con el que Euler Mejorado es estable (RK4: ~2.78)
+LIMITE_ESTABILIDAD = 2.0
+# Por arriba de este valor de max(-∂f/∂y) * (x_final - x0) la ecuación se
+# considera rígida: un método explícito necesitaría más de
+# UMBRAL_RIGIDEZ / LIMITE_ESTABILIDAD pasos sólo para ser estable
+UMBRAL_RIGIDEZ = 1000.0
+# Si Newton tarda más de estas iteraciones, el jacobiano se recalcula
+ITERACIONES_LENTAS = 3
+# Fracción del paso de la etapa del trapecio en TR-BDF2
+GAMMA = 2 - math.sqrt(2)
+
+
+def trapecio_implicito(f, dfdy, x0, y0, h, x_final, tol=1e-10, max_iter=20, reusar_jacobiano=True,
+                       estadisticas=None, callback=None):
+    """
+    Resuelve dy/dx = f(x, y) con y(x0) = y0 usando TR-BDF2 (regla del
+    trapecio implícita seguida de BDF2 en cada paso). dfdy(x, y) es ∂f/∂y
+    (por ejemplo, compilar_derivada(ecuacion, 'y', ('x', 'y'))).
+
+    Cada etapa se resuelve con newton_raphson partiendo del último valor,
+    con ∂f/∂y fija durante la etapa (Newton simplificado). Con
+    reusar_jacobiano=True ∂f/∂y además se reutiliza entre etapas y pasos y
+    sólo se vuelve a evaluar cuando Newton converge lento (más de
+    ITERACIONES_LENTAS iteraciones). Si con ∂f/∂y fija no converge, la
+    etapa se repite con Newton completo.
+
+    La malla es la misma que la de euler_mejorado. En estadisticas, las
+    evaluaciones de ∂f/∂y se cuentan en evaluaciones_df. Lanza RuntimeError
+    si Newton no converge en algún paso.
+    """
+    if estadisticas is not None:
+        f = contar(f, estadisticas)
+        dfdy = contar(dfdy, estadisticas, "evaluaciones_df")
+
+    with fase(estadisticas, "malla"):
+        x = np.arange(x0, x_final + h, h)
+        y = np.zeros(len(x))
+        y[0] = y0
+
+    # Coeficientes de la etapa BDF2; d * h = GAMMA * h / 2, el mismo G'(z) que la etapa del trapecio
+    a = 1 / (GAMMA * (2 - GAMMA))
+    b = (1 - GAMMA) ** 2 * a
+    d = (1 - GAMMA) / (2 - GAMMA)
+
+    J = None
+
+    def resolver(G, x_nuevo, z0):
+        """Resuelve G(z) = 0 con G'(z) = 1 - d*h*∂f/∂y; regresa la raíz."""
+        nonlocal J
+        if J is None or not reusar_jacobiano:
+            J = dfdy(x_nuevo, z0)
+        raiz, iteraciones, estado, mensaje = newton_raphson_estado(
+            G, lambda z: 1 - d * h * J, z0, tol, max_iter
+        )
+        if estado != CONVERGIO:
+            # Con el jacobiano fijo no alcanzó: Newton completo, evaluando ∂f/∂y en cada iterado
+            raiz, iteraciones, estado, mensaje = newton_raphson_estado(
+                G, lambda z: 1 - d * h * dfdy(x_nuevo, z), z0, tol, max_iter
+            )
+            if estado != CONVERGIO:
+                raise RuntimeError(f"Newton-Raphson no convergió en x = {x_nuevo:g}: {mensaje}")
+            J = None
+        elif len(iteraciones) - 1 > ITERACIONES_LENTAS:
+            J = None
+        return raiz
+
+    with fase(estadisticas, "pasos"):
+        for i in range(0, len(x) - 1):
+            fi = f(x[i], y[i])
+            x_gamma = x[i] + GAMMA * (x[i+1] - x[i])
+            # Con h * ∂f/∂y grande el predictor de Euler se dispara; y[i] es más seguro
+            y_gamma = resolver(lambda z: z - y[i] - d * h * (fi + f(x_gamma, z)), x_gamma, y[i])
+            c = a * y_gamma - b * y[i]
+            y[i+1] = resolver(lambda z: z - c - d * h * f(x[i+1], z), x[i+1], y_gamma)
+            if callback is not None:
+                callback(i + 1, x[i+1], y[i+1])
+
+    if estadisticas is not None:
+        estadisticas.iteraciones = len(x) - 1
+    return x, y
+
+
+def rigidez(f, dfdy, x0, y0, x_final, muestras=20):
+    """
+    Estima λ = max(-∂f/∂y) a lo largo de la solución.
+
+    La solución se aproxima con una corrida gruesa de trapecio_implicito de
+    `muestras` pasos (estable aunque la ecuación sea rígida). Regresa 0 si
+    ∂f/∂y no es negativa en ningún punto (no hay modos que decaigan rápido).
+    """
+    x, y = trapecio_implicito(f, dfdy, x0, y0, (x_final - x0) / muestras, x_final, tol=1e-8)
+    lam = -np.broadcast_to(dfdy(x, y), x.shape)
+    return max(0.0, float(np.nanmax(lam)))
+
+
+def es_rigida(f, dfdy, x0, y0, x_final, muestras=20):
+    """
+    Indica si conviene usar trapecio_implicito en lugar de un método explícito.
+
+    Regresa (rigida, lam): rigida es True si lam * (x_final - x0) supera
+    UMBRAL_RIGIDEZ; con lam > 0, los métodos explícitos sólo son estables
+    con h < LIMITE_ESTABILIDAD / lam.
+    """
+    lam = rigidez(f, dfdy, x0, y0, x_final, muestras)
+    return lam * abs(x_final - x0) > UMBRAL_RIGIDEZ, lam